@@ -1,6 +1,7 @@
 """Command line interface for the benchmark framework."""
 
 import copy
+import json
 from pathlib import Path
 from typing import Any
 
@@ -21,12 +22,6 @@ except ImportError:
 
 from ..config import load_config
 from ..debug import set_debug
-from ..gather.system_probe import probe_all
-from ..infra.manager import InfraManager
-from ..infra.self_managed import SelfManagedDeployment, get_self_managed_deployment
-from ..package.creator import create_workload_zip
-from ..report.render import render_global_report_index, render_report
-from ..run.runner import run_benchmark
 
 # Import from refactored modules
 from .probing import probe_managed_systems, probe_remote_systems
@@ -38,6 +33,9 @@ from .status import (
 )
 from .workflows import report_query_results, run_probe_for_full, run_report_for_full
 
+# Heavy subsystems (reporting, runners, infra, packaging) are imported inside
+# the commands that use them so that `benchkit <cmd> --help` stays fast.
+
 app = typer.Typer(
     name="benchkit",
     help="Database benchmark framework for generating reproducible reports",
@@ -124,6 +122,8 @@ def probe(
 
     if not has_cloud and not has_managed and not has_remote:
         # Local benchmark - probe current system
+        from ..gather.system_probe import probe_all
+
         meta = probe_all(outdir)
         console.print(f"[green]✓ System probe saved to:[/] {outdir / 'system.json'}")
         console.print(
@@ -476,6 +476,8 @@ def execute(
     cfg["systems"] = system_configs
 
     console.print(f"[blue]Executing workload for system:[/] {system}")
+    from ..run.runner import run_benchmark
+
     run_benchmark(cfg, outdir)
 
 
@@ -495,6 +497,7 @@ def report(
     ),
 ) -> None:
     """Generate report from benchmark results or rebuild the report index."""
+    from ..report.render import render_global_report_index, render_report
 
     if config is None:
         index_path = Path(index_dir)
@@ -943,10 +946,63 @@ def _dump_config_yaml(cfg: dict[str, Any], config_path: Path | str) -> None:
             print_yaml_value(k, v, indent=1)
 
 
+def _check_config_result(
+    config: str, skip_aws_check: bool, preflight: bool = True
+) -> dict[str, Any]:
+    """Validate a single config file for ``check --json``.
+
+    Runs the same config loading and pre-flight validation as the interactive
+    check, but collects the outcome instead of rendering it. With
+    ``preflight=False`` only the config schema is validated.
+
+    Returns:
+        Dict with ``path``, ``ok`` and ``error`` (None when valid)
+    """
+    from ..common.cli_helpers import is_any_system_cloud_mode, is_any_system_remote_mode
+    from ..validation import CheckSeverity, PreflightChecker
+
+    result: dict[str, Any] = {"path": config, "ok": False, "error": None}
+    try:
+        cfg = load_config(config)
+    except FileNotFoundError:
+        result["error"] = f"Configuration file not found: {config}"
+        return result
+    except ValueError as e:
+        result["error"] = str(e).replace("Invalid configuration: ", "")
+        return result
+    except Exception as e:
+        result["error"] = f"Unexpected error: {e}"
+        return result
+
+    if preflight and (is_any_system_cloud_mode(cfg) or is_any_system_remote_mode(cfg)):
+        checker = PreflightChecker(cfg, skip_aws_checks=skip_aws_check)
+        validation_report = checker.run_check_command_validation()
+        if validation_report.has_errors:
+            failed = [
+                f"{c.name}: {c.message}"
+                for c in validation_report.checks
+                if not c.passed and c.severity == CheckSeverity.ERROR
+            ]
+            result["error"] = "Pre-flight validation failed: " + "; ".join(failed)
+            return result
+
+    result["ok"] = True
+    return result
+
+
 @app.command()
 def check(
-    config: str = typer.Option(
-        ..., "--config", "-c", help="Path to config YAML file", envvar="BENCHKIT_CONFIG"
+    config: str | None = typer.Option(
+        None,
+        "--config",
+        "-c",
+        help="Path to config YAML file",
+        envvar="BENCHKIT_CONFIG",
+    ),
+    extra_configs: list[str] | None = typer.Argument(
+        None,
+        metavar="[CONFIGS]...",
+        help="More config files to validate in the same run (implies --json)",
     ),
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Show all configuration details"
@@ -962,12 +1018,31 @@ def check(
         "--skip-aws-check",
         help="Skip AWS API validation (for offline validation)",
     ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Print per-config validation results as JSON (implied for several configs)",
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        "--schema-only",
+        help="Only validate the config schema (no pre-flight checks or details)",
+        envvar="BENCHKIT_FAST_CHECK",
+    ),
 ) -> None:
     """Check and display configuration file contents.
 
     With --dump, outputs the expanded configuration as commented YAML that can be
     redirected to a file. This shows all default values that were auto-filled.
 
+    With --json (or when config paths are passed as arguments), validates every
+    config in one invocation and prints a JSON list of {"path", "ok", "error"}
+    objects. Exits with code 1 if any config is invalid.
+
+    With --fast (or BENCHKIT_FAST_CHECK=1), only the config schema is validated:
+    SSH key and AWS pre-flight checks and the detailed summary are skipped.
+
     For cloud modes (aws/gcp/azure), validates SSH key configuration including:
     - File existence and permissions
     - AWS key pair existence and fingerprint match (unless --skip-aws-check)
@@ -977,14 +1052,31 @@ def check(
     from rich.panel import Panel
     from rich.text import Text
 
-    config_path = Path(config)
+    configs = ([config] if config else []) + (extra_configs or [])
+    if not configs:
+        console.print("[red]No config given: use -c/--config or pass paths[/red]")
+        raise typer.Exit(1)
+
+    if json_output or len(configs) > 1:
+        if dump or verbose:
+            console.print("[red]--dump/--verbose require a single config[/red]")
+            raise typer.Exit(1)
+        results = [
+            _check_config_result(c, skip_aws_check, preflight=not fast) for c in configs
+        ]
+        typer.echo(json.dumps(results, indent=2))
+        if not all(r["ok"] for r in results):
+            raise typer.Exit(1)
+        return
+
+    config_path = Path(configs[0])
 
     # Try to load and validate the config
     validation_errors: list[str] = []
     cfg: dict[str, Any] | None = None
 
     try:
-        cfg = load_config(config)
+        cfg = load_config(str(config_path))
     except FileNotFoundError as e:
         console.print(
             Panel(
@@ -1026,6 +1118,10 @@ def check(
         _dump_config_yaml(cfg, config_path)
         return
 
+    if fast:
+        console.print(f"[green]✓ Valid:[/green] {config_path} [dim](schema only)[/dim]")
+        return
+
     # Config is valid - display it with rich formatting
     status_text = Text()
     status_text.append("Configuration: ", style="bold")
@@ -1300,6 +1396,7 @@ def _apply_managed_systems(cfg: dict[str, Any]) -> bool:
     """
     from ..common.cli_helpers import get_managed_deployment_dir, get_managed_systems
     from ..infra.managed_state import save_managed_state
+    from ..infra.self_managed import get_self_managed_deployment
 
     managed_systems = get_managed_systems(cfg)
     project_id = cfg.get("project_id", "default")
@@ -1419,6 +1516,8 @@ def _destroy_all_environments(cfg: dict[str, Any]) -> tuple[bool, list[str]]:
     from ..common.cli_helpers import get_all_environments, get_managed_deployment_dir
     from ..common.enums import EnvironmentMode
     from ..infra.managed_state import clear_managed_state
+    from ..infra.manager import InfraManager
+    from ..infra.self_managed import SelfManagedDeployment, get_self_managed_deployment
 
     environments = get_all_environments(cfg)
     project_id = cfg.get("project_id", "default")
@@ -1769,6 +1868,8 @@ def infra(
 
     # For plan and apply actions on cloud systems, use InfraManager
     if has_cloud and provider:
+        from ..infra.manager import InfraManager
+
         manager = InfraManager(provider, cfg)
         console.print(f"  State:   [cyan]{manager.project_state_dir}[/cyan]")
         console.print()
@@ -1857,6 +1958,8 @@ def package(
     if systems:
         console.print(f"[dim]Systems: {[s['name'] for s in cfg['systems']]}[/]")
 
+    from ..package.creator import create_workload_zip
+
     package_path = create_workload_zip(cfg, output_path, force)
     console.print(f"[green]✓ ZIP package created:[/] {package_path}")
 
@@ -2157,6 +2260,7 @@ def combine(
             --no-report
     """
     from ..combine import BenchmarkCombiner, parse_source_arg
+    from ..report.render import render_report
 
     set_debug(debug)
 
@@ -6,11 +6,14 @@ from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ValidationError, field_validator, model_validator
 
 from .common.enums import EnvironmentMode
 from .common.markers import exclude_from_package
 
+# Use the libyaml-backed loader when PyYAML was built with it (much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class SystemConfig(BaseModel):
     """Configuration for a system under test."""
@@ -452,11 +455,65 @@ def load_config(path: str | Path) -> dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_path, encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=_YAML_LOADER)  # nosec B506
+
+    raw_config = _apply_config_defaults(raw_config, config_path.stem)
+
+    # Validate using Pydantic model
+    try:
+        validated_config = BenchmarkConfig(**raw_config)
+        result: dict[str, Any] = validated_config.model_dump()
+        return result
+    except Exception as e:
+        raise ValueError(f"Invalid configuration: {e}") from e
+
+
+@exclude_from_package
+def validate_config_text(text: str, project_id: str = "config") -> list[str]:
+    """Validate benchmark configuration YAML text in-process.
+
+    Applies the same defaults and model validation as load_config(), but
+    takes the YAML content directly and reports problems instead of raising.
 
+    Args:
+        text: Configuration file content
+        project_id: Default project_id if the config does not set one
+
+    Returns:
+        List of validation error messages (empty if the config is valid)
+    """
+    try:
+        raw_config = yaml.load(text, Loader=_YAML_LOADER)  # nosec B506
+    except yaml.YAMLError as e:
+        return [f"Invalid YAML: {e}"]
+    if not isinstance(raw_config, dict):
+        return ["Configuration must be a YAML mapping"]
+
+    raw_config = _apply_config_defaults(raw_config, project_id)
+
+    try:
+        BenchmarkConfig(**raw_config)
+    except ValidationError as e:
+        return [
+            (
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                if err["loc"]
+                else err["msg"]
+            )
+            for err in e.errors()
+        ]
+    except Exception as e:
+        return [str(e)]
+    return []
+
+
+def _apply_config_defaults(
+    raw_config: dict[str, Any], default_project_id: str
+) -> dict[str, Any]:
+    """Fill in project_id and report path defaults, then expand env vars."""
     # Set default project_id from config filename if not specified
     if "project_id" not in raw_config or not raw_config["project_id"]:
-        raw_config["project_id"] = config_path.stem
+        raw_config["project_id"] = default_project_id
 
     # Set default report paths if not specified
     if "report" not in raw_config:
@@ -483,15 +540,8 @@ def load_config(path: str | Path) -> dict[str, Any]:
         raw_config["report"]["index_output_dir"] = "results"
 
     # Expand environment variables in config
-    raw_config = _expand_env_vars(raw_config)
-
-    # Validate using Pydantic model
-    try:
-        validated_config = BenchmarkConfig(**raw_config)
-        result: dict[str, Any] = validated_config.model_dump()
-        return result
-    except Exception as e:
-        raise ValueError(f"Invalid configuration: {e}") from e
+    expanded: dict[str, Any] = _expand_env_vars(raw_config)
+    return expanded
 
 
 def _expand_env_vars(obj: Any) -> Any:
@@ -1,8 +1,8 @@
 """File-based logging with real-time writing."""
 
+import os
 import threading
-from collections.abc import Callable
-from io import TextIOWrapper
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -13,18 +13,33 @@ class FileLogger:
     """Thread-safe file writer for system logs.
 
     Provides real-time file-based logging with Rich markup stripping
-    for clean, parseable log files.
+    for clean, parseable log files. Lines are encoded once and written
+    straight to the file descriptor, so each write is a single syscall
+    with no text-layer buffering to flush.
     """
 
+    # Truncate like open(..., "w"); O_BINARY keeps Windows from translating newlines
+    _OPEN_FLAGS = (
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    )
+
     def __init__(self, log_path: Path):
         self.log_path = log_path
         self._lock = threading.Lock()
-        self._file: TextIOWrapper | None = None
+        self._fd: int | None = None
 
     def open(self) -> None:
         """Open the log file for writing."""
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = open(self.log_path, "w", encoding="utf-8", buffering=1)
+        self._fd = os.open(self.log_path, self._OPEN_FLAGS, 0o644)
+
+    def _write_payload(self, payload: str) -> None:
+        """Write encoded text to the open descriptor (caller holds the lock)."""
+        assert self._fd is not None
+        view = memoryview(payload.encode("utf-8"))
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
 
     def write(self, message: str) -> None:
         """Write message to log file (thread-safe).
@@ -37,18 +52,33 @@ class FileLogger:
             message: Message to write (may contain Rich markup)
         """
         with self._lock:
-            if self._file:
+            if self._fd is not None:
                 # Strip markup and normalize whitespace for consistent tag formatting
                 clean = strip_markup(message).strip()
                 if clean:  # Only write non-empty lines
-                    self._file.write(clean + "\n")
+                    self._write_payload(clean + "\n")
+
+    def write_lines(self, messages: Iterable[str]) -> None:
+        """Write several messages with a single file write (thread-safe).
+
+        Each message is cleaned exactly as in write(); empty results are skipped.
+
+        Args:
+            messages: Messages to write, in order
+        """
+        with self._lock:
+            if self._fd is not None:
+                cleaned = (strip_markup(message).strip() for message in messages)
+                payload = "".join(f"{clean}\n" for clean in cleaned if clean)
+                if payload:
+                    self._write_payload(payload)
 
     def close(self) -> None:
         """Close the log file."""
         with self._lock:
-            if self._file:
-                self._file.close()
-                self._file = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
 
     def create_callback(self) -> Callable[[str], None]:
         """Create callback for output routing.
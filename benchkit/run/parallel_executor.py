@@ -13,15 +13,17 @@ Architecture:
 
 from __future__ import annotations
 
+import itertools
 import re
 import sys
 import threading
 import time
 import traceback
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from .file_logger import FileLogger
 from .tail_monitor import TailMonitor
@@ -54,8 +56,31 @@ class ParallelExecutor:
     Uses FileLogger for real-time file writes and explicit callbacks
     for output routing. This avoids race conditions inherent in
     redirect_stdout approaches.
+
+    Recorded lines are appended to a per-task buffer and written to the log
+    files in batches by a single consumer thread, so producers never block on
+    file I/O or on each other.
     """
 
+    # Buffered lines per task that wake the consumer before its next interval
+    BATCH_THRESHOLD = 64
+    # Maximum delay (seconds) before buffered lines reach the log files
+    FLUSH_INTERVAL = 0.05
+
+    # Minimum size of the worker pool shared by all executors
+    SHARED_POOL_MIN_WORKERS = 32
+
+    # Worker threads are shared across executors (one per phase in a run) and
+    # spawned lazily, so later phases reuse idle threads instead of creating
+    # and joining a fresh pool. Each run submits at most max_workers tasks at
+    # a time, and the pool grows when concurrent runs need more workers. A
+    # replaced pool stays up until the last run holding it releases it.
+    _shared_pool: ClassVar[ThreadPoolExecutor | None] = None
+    _shared_pool_size: ClassVar[int] = 0
+    _shared_pool_demand: ClassVar[int] = 0
+    _pool_users: ClassVar[dict[ThreadPoolExecutor, int]] = {}
+    _shared_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         max_workers: int = 2,
@@ -87,6 +112,13 @@ class ParallelExecutor:
         self._file_loggers: dict[str, FileLogger] = {}
         self._log_paths: dict[str, Path] = {}
 
+        # Per-task line buffers drained by the consumer thread
+        self._buffers: dict[str, deque[str]] = {}
+        self._log_errors: dict[str, Exception] = {}
+        self._wake = threading.Event()
+        self._stop_consumer = threading.Event()
+        self._consumer: threading.Thread | None = None
+
         # Console for display
         if console is None:
             from rich.console import Console
@@ -133,6 +165,7 @@ class ParallelExecutor:
             phase_log_dir = Path(log_dir) / self._slugify(phase_name)
             phase_log_dir.mkdir(parents=True, exist_ok=True)
             self._setup_loggers(tasks.keys(), phase_log_dir)
+            self._start_consumer()
 
         # Start tail monitor for real-time display
         monitor: TailMonitor | None = None
@@ -140,17 +173,23 @@ class ParallelExecutor:
             monitor = TailMonitor(self._log_paths, self._console)
             monitor.start()
 
-        future_to_name = {}
+        workers = max(1, min(self.max_workers, len(tasks)))
+        pool = self._acquire_shared_pool(workers)
+        pending = iter(tasks.items())
+        running: dict[Future[Any], str] = {}
 
         try:
-            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
-                for name, task in tasks.items():
-                    self._record_line(name, "Task queued")
-                    future = pool.submit(self._wrap_task, name, task)
-                    future_to_name[future] = name
-
-                for future in as_completed(future_to_name):
-                    name = future_to_name[future]
+            for name in tasks:
+                self._record_line(name, "Task queued")
+
+            # Keep at most `workers` tasks in the shared pool at any time
+            for name, task in itertools.islice(pending, workers):
+                running[pool.submit(self._wrap_task, name, task)] = name
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
                     try:
                         result = future.result()
                         with self._state_lock:
@@ -164,7 +203,22 @@ class ParallelExecutor:
                             self.status[name] = f"Failed: {exc}"[:200]
                             self.finish_times[name] = time.time()
                         self._record_line(name, f"[status] Failed: {exc}")
+
+                    next_task = next(pending, None)
+                    if next_task is not None:
+                        next_name, task = next_task
+                        future = pool.submit(self._wrap_task, next_name, task)
+                        running[future] = next_name
         finally:
+            # Like leaving a pool's with-block: let started tasks finish
+            if running:
+                wait(running)
+            self._release_shared_pool(pool, workers)
+
+            # Write out everything still buffered before the files are closed
+            self._stop_consumer_thread()
+            self._fail_tasks_with_log_errors()
+
             # Stop monitor
             if monitor:
                 monitor.stop()
@@ -232,7 +286,21 @@ class ParallelExecutor:
             callback = executor.create_output_callback("exasol")
             system = create_system(config, output_callback=callback)
             # Now system._log() will route to the correct task log file
+
+        While the task is part of the current run, the callback appends
+        straight to the task's buffer. Messages are coerced to str so a
+        non-string never reaches the consumer thread; FileLogger strips the
+        message when it is written, and the consumer picks the line up on its
+        next interval.
         """
+        buffer = self._buffers.get(task_name)
+        if buffer is not None:
+            append = buffer.append
+
+            def buffered_callback(message: str) -> None:
+                append(str(message))
+
+            return buffered_callback
 
         def callback(message: str) -> None:
             self._record_line(task_name, message)
@@ -254,8 +322,72 @@ class ParallelExecutor:
             self.status[name] = status
         self._record_line(name, f"[status] {status}")
 
+    @classmethod
+    def shutdown_shared(cls) -> None:
+        """Shut down the shared worker pool, waiting for running tasks.
+
+        A new pool is created on the next execute_parallel() call. A pool that
+        a running execute_parallel() call still holds is shut down when that
+        call releases it.
+        """
+        with cls._shared_pool_lock:
+            pool = cls._shared_pool
+            cls._shared_pool = None
+            cls._shared_pool_size = 0
+            if pool in cls._pool_users:
+                return
+        if pool is not None:
+            pool.shutdown(wait=True)
+
     # Internal helpers -------------------------------------------------
 
+    @classmethod
+    def _acquire_shared_pool(cls, workers: int) -> ThreadPoolExecutor:
+        """Reserve workers in the shared pool, growing it if needed.
+
+        The returned pool must be passed back to _release_shared_pool().
+        """
+        retired: ThreadPoolExecutor | None = None
+        with cls._shared_pool_lock:
+            cls._shared_pool_demand += workers
+            if (
+                cls._shared_pool is None
+                or cls._shared_pool_size < cls._shared_pool_demand
+            ):
+                # Runs still holding the old pool keep submitting to it; the
+                # last of them shuts it down on release
+                if cls._shared_pool not in cls._pool_users:
+                    retired = cls._shared_pool
+                cls._shared_pool_size = max(
+                    cls._shared_pool_demand, cls.SHARED_POOL_MIN_WORKERS
+                )
+                cls._shared_pool = ThreadPoolExecutor(
+                    max_workers=cls._shared_pool_size,
+                    thread_name_prefix="benchkit-task",
+                )
+            pool = cls._shared_pool
+            cls._pool_users[pool] = cls._pool_users.get(pool, 0) + 1
+        if retired is not None:
+            retired.shutdown(wait=False)
+        return pool
+
+    @classmethod
+    def _release_shared_pool(cls, pool: ThreadPoolExecutor, workers: int) -> None:
+        """Return workers reserved by _acquire_shared_pool().
+
+        A pool that is no longer the shared one is shut down once its last
+        run has released it.
+        """
+        with cls._shared_pool_lock:
+            cls._shared_pool_demand -= workers
+            cls._pool_users[pool] -= 1
+            if cls._pool_users[pool]:
+                return
+            del cls._pool_users[pool]
+            if pool is cls._shared_pool:
+                return
+        pool.shutdown(wait=False)
+
     def _reset_state(self, tasks: dict[str, Callable[[], Any]]) -> None:
         """Reset internal state for a new execution run."""
         current = time.time()
@@ -265,6 +397,8 @@ class ParallelExecutor:
         self.results = {}
         self._file_loggers = {}
         self._log_paths = {}
+        self._buffers = {}
+        self._log_errors = {}
 
     def _setup_loggers(self, task_names: Any, log_dir: Path) -> None:
         """Create file loggers for each task."""
@@ -275,6 +409,60 @@ class ParallelExecutor:
             logger.open()
             self._file_loggers[name] = logger
             self._log_paths[name] = log_path
+            self._buffers[name] = deque()
+
+    def _start_consumer(self) -> None:
+        """Start the thread that writes buffered lines to the log files."""
+        self._wake.clear()
+        self._stop_consumer.clear()
+        self._consumer = threading.Thread(target=self._consume_events, daemon=True)
+        self._consumer.start()
+
+    def _stop_consumer_thread(self) -> None:
+        """Stop the consumer thread after it has drained all buffers."""
+        if self._consumer is None:
+            return
+        self._stop_consumer.set()
+        self._wake.set()
+        self._consumer.join()
+        self._consumer = None
+
+    def _consume_events(self) -> None:
+        """Drain task buffers every FLUSH_INTERVAL or when woken by a producer."""
+        while not self._stop_consumer.is_set():
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._drain_buffers()
+        # Pick up lines recorded between the last drain and the stop request
+        self._drain_buffers()
+
+    def _drain_buffers(self) -> None:
+        """Write each task's buffered lines to its log file in one batch.
+
+        Only the lines present when the drain starts are taken; anything a
+        producer appends meanwhile stays queued for the next pass.
+        """
+        for name, buffer in self._buffers.items():
+            pending = len(buffer)
+            if not pending:
+                continue
+            popleft = buffer.popleft
+            batch = [popleft() for _ in range(pending)]
+            try:
+                self._file_loggers[name].write_lines(batch)
+            except Exception as exc:
+                # Keep draining the other tasks; the run marks this one failed
+                if name not in self._log_errors:
+                    self._log_errors[name] = exc
+                    self._print_line(f"[{name}] Failed to write log: {exc}")
+
+    def _fail_tasks_with_log_errors(self) -> None:
+        """Mark tasks whose log lines could not be written as failed."""
+        for name, exc in self._log_errors.items():
+            with self._state_lock:
+                self.results[name] = None
+                if not self.status.get(name, "").startswith("Failed"):
+                    self.status[name] = f"Failed: log write error: {exc}"[:200]
 
     def _close_loggers(self) -> None:
         """Close all file loggers."""
@@ -282,17 +470,24 @@ class ParallelExecutor:
             logger.close()
 
     def _record_line(self, name: str, message: str) -> None:
-        """Record a line to the task's file logger.
+        """Buffer a line for the task's file logger.
+
+        The consumer thread writes it to the log file, where TailMonitor
+        displays it with the proper prefix. Buffers are allocated for every
+        logged task before submission, so a single lookup suffices; lines for names
+        outside the current run (e.g. a callback kept past its phase) are
+        dropped, as are all lines when the run has no log directory.
 
-        TailMonitor handles displaying the output from log files with proper
-        prefixes, so we only write to the file logger here.
+        No lock is taken: deque.append and popleft are atomic, and the
+        consumer is the only thread that pops.
         """
-        clean = message.rstrip("\n\r")
+        buffer = self._buffers.get(name)
+        if buffer is None:
+            return
 
-        # Write to file logger - TailMonitor will display it
-        logger = self._file_loggers.get(name)
-        if logger:
-            logger.write(clean)
+        buffer.append(message.rstrip("\n\r"))
+        if len(buffer) >= self.BATCH_THRESHOLD:
+            self._wake.set()
 
     def _print_summary(self, phase_name: str) -> None:
         """Print execution summary."""
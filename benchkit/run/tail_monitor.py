@@ -1,8 +1,8 @@
 """Tail-f style monitoring for multiple log files."""
 
 import threading
-import time
 from pathlib import Path
+from typing import TextIO
 
 from rich.console import Console
 
@@ -11,6 +11,8 @@ class TailMonitor:
     """Monitor log files with simple tail-f style output.
 
     Prints new lines from log files as they appear, prefixed with system name.
+    Each log is opened once and read incrementally; the loop waits on an event
+    between passes, so stop() wakes it immediately.
     """
 
     LINES_PER_SYSTEM = 5
@@ -25,14 +27,15 @@ class TailMonitor:
         """
         self.log_files = log_files
         self.console = console
-        self._positions: dict[str, int] = {}
+        self._handles: dict[str, TextIO] = {}
+        # Display prefix per system, built once; lines already carrying it
+        # (e.g. forwarded remote output) are printed unchanged
+        self._tags = {name: f"[{name}] " for name in log_files}
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
 
     def start(self) -> None:
         """Start the monitoring thread."""
-        for name in self.log_files:
-            self._positions[name] = 0
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
@@ -51,27 +54,41 @@ class TailMonitor:
         Returns:
             List of new lines read from the file
         """
-        path = self.log_files[name]
-        if not path.exists():
-            return []
         try:
-            with open(path, encoding="utf-8") as f:
-                f.seek(self._positions[name])
-                lines = [line.rstrip() for line in f if line.strip()]
-                self._positions[name] = f.tell()
-            return lines
+            handle = self._handles.get(name)
+            if handle is None:
+                # The file may not exist yet; retry on the next pass
+                handle = open(self.log_files[name], encoding="utf-8")
+                self._handles[name] = handle
+            return [line.rstrip() for line in handle.readlines() if line.strip()]
         except OSError:
             return []
 
+    def _close_handles(self) -> None:
+        """Close all open log files."""
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
     def _run(self) -> None:
         """Main monitoring loop - prints lines as they appear."""
-        while not self._stop.is_set():
-            for name in self.log_files:
-                new_lines = self._read_new_lines(name)
-                if new_lines:
-                    # Limit to last N lines per cycle
-                    lines_to_print = new_lines[-self.LINES_PER_SYSTEM :]
-                    for line in lines_to_print:
-                        # Use markup=False to ensure prefix appears even in non-terminal output
-                        self.console.print(f"[{name}] {line}", markup=False)
-            time.sleep(self.REFRESH_RATE)
+        try:
+            while not self._stop.is_set():
+                self._print_new_lines()
+                self._stop.wait(self.REFRESH_RATE)
+        finally:
+            self._close_handles()
+
+    def _print_new_lines(self) -> None:
+        """Print the latest new lines of every log file."""
+        for name in self.log_files:
+            new_lines = self._read_new_lines(name)
+            if new_lines:
+                # Limit to last N lines per cycle
+                lines_to_print = new_lines[-self.LINES_PER_SYSTEM :]
+                tag = self._tags[name]
+                for line in lines_to_print:
+                    if not line.startswith(tag):
+                        line = tag + line
+                    # Use markup=False to ensure prefix appears even in non-terminal output
+                    self.console.print(line, markup=False)
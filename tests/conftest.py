@@ -0,0 +1,69 @@
+"""Shared pytest configuration for the unit test suite.
+
+Available options:
+    --thorough  Also run the large tier of the parallel output stress tests
+
+Tests marked ``requires_crypto`` are skipped when cryptography is missing.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Iterator
+
+import pytest
+
+from benchkit.run.parallel_executor import ParallelExecutor
+
+# (num_tasks, iterations) tiers for the parallel output stress tests. The fast
+# tier always runs; the thorough tiers reproduce the original load shapes.
+STRESS_TIERS_FAST = [(4, 50)]
+STRESS_TIERS_THOROUGH = [(8, 500), (4, 1000)]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add unit test command line options."""
+    parser.addoption(
+        "--thorough",
+        action="store_true",
+        default=False,
+        help="Run the thorough tier of the parallel output stress tests",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip ``requires_crypto`` tests when cryptography is not installed.
+
+    Without it the SSH key format and readability checks report a
+    pass-with-warning instead of validating anything.
+    """
+    if importlib.util.find_spec("cryptography") is not None:
+        return
+    skip = pytest.mark.skip(reason="cryptography is not installed")
+    for item in items:
+        if "requires_crypto" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize stress tests that request ``num_tasks`` and ``iterations``."""
+    if not {"num_tasks", "iterations"} <= set(metafunc.fixturenames):
+        return
+
+    tiers = list(STRESS_TIERS_FAST)
+    if metafunc.config.getoption("--thorough", default=False):
+        tiers += STRESS_TIERS_THOROUGH
+    metafunc.parametrize(
+        ("num_tasks", "iterations"),
+        tiers,
+        ids=[f"{tasks}x{iters}" for tasks, iters in tiers],
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _shutdown_shared_pool() -> Iterator[None]:
+    """Shut down the ParallelExecutor worker pool shared across tests."""
+    yield
+    ParallelExecutor.shutdown_shared()
@@ -0,0 +1,53 @@
+"""Subprocess helpers for invoking the benchkit CLI in E2E tests."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Sequence
+from typing import Any, Literal, overload
+
+# Base argv for running the CLI from the current interpreter environment
+BENCHKIT_ARGV = ("python", "-m", "benchkit")
+
+
+@overload
+def run_cli(
+    args: Sequence[str], *, timeout: int | None = ..., decode: Literal[False] = ...
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+@overload
+def run_cli(
+    args: Sequence[str], *, timeout: int | None = ..., decode: Literal[True]
+) -> subprocess.CompletedProcess[str]: ...
+
+
+def run_cli(
+    args: Sequence[str], *, timeout: int | None = None, decode: bool = False
+) -> subprocess.CompletedProcess[Any]:
+    """Run ``python -m benchkit <args>`` and capture its output.
+
+    Output is kept as bytes unless decode=True, so tests that only check the
+    exit code never decode it. Use output_text() in failure messages.
+
+    Args:
+        args: CLI arguments after ``benchkit``
+        timeout: Timeout in seconds
+        decode: Return stdout/stderr as str instead of bytes
+
+    Returns:
+        Completed process with captured stdout and stderr
+    """
+    return subprocess.run(
+        (*BENCHKIT_ARGV, *args), capture_output=True, text=decode, timeout=timeout
+    )
+
+
+def output_text(result: subprocess.CompletedProcess[Any]) -> str:
+    """Format captured stdout/stderr for an assertion message."""
+    stdout, stderr = result.stdout, result.stderr
+    if isinstance(stdout, bytes):
+        stdout = stdout.decode(errors="replace")
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors="replace")
+    return f"stdout: {stdout}\nstderr: {stderr}"
@@ -20,6 +20,8 @@ from typing import Any
 import pytest
 import yaml
 
+from .verification import ResultsDirIndex
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers for E2E tests."""
@@ -130,6 +132,15 @@ def results_dir(project_id: str) -> Path:
     return Path("results") / project_id
 
 
+@pytest.fixture(scope="session")
+def results_dir_index(results_dir: Path) -> ResultsDirIndex:
+    """Return a shared file-name index of the results directory.
+
+    Call .refresh() after a phase writes new files into results_dir.
+    """
+    return ResultsDirIndex(results_dir)
+
+
 @pytest.fixture(scope="session")
 def expected_systems(loaded_config: dict[str, Any]) -> list[str]:
     """Return list of expected system names from config."""
@@ -149,10 +160,13 @@ def _cleanup_e2e_artifacts(project_id: str) -> None:
     - packages/{project_id}_workload/ - package directory
     - packages/{project_id}_workload.zip - package zip file
     """
+    # Removal tolerates concurrent deletion: under pytest-xdist every worker
+    # runs this session fixture.
+
     # Results directory
     results_dir = Path("results") / project_id
     if results_dir.exists():
-        shutil.rmtree(results_dir)
+        shutil.rmtree(results_dir, ignore_errors=True)
 
     # Package directory and zip
     packages_dir = Path("packages")
@@ -160,11 +174,10 @@ def _cleanup_e2e_artifacts(project_id: str) -> None:
 
     package_dir = packages_dir / package_name
     if package_dir.exists():
-        shutil.rmtree(package_dir)
+        shutil.rmtree(package_dir, ignore_errors=True)
 
     package_zip = packages_dir / f"{package_name}.zip"
-    if package_zip.exists():
-        package_zip.unlink()
+    package_zip.unlink(missing_ok=True)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -232,4 +245,5 @@ def timeouts() -> dict[str, int]:
         "package": 120,  # 2 minutes
         "status": 60,  # 1 minute
         "check": 30,  # 30 seconds
+        "help": 30,  # 30 seconds
     }
@@ -3,16 +3,41 @@
 These tests verify CLI commands work correctly without provisioning infrastructure.
 They can be run without the --e2e flag.
 
-Run with: pytest tests/e2e/test_cli_validation.py -v
+Every test works on its own tmp_path and only invokes the CLI read-only, so the
+classes are safe to distribute across pytest-xdist workers.
+
+Run with: pytest tests/e2e/test_cli_validation.py -m e2e_dryrun -n auto -v
 """
 
 from __future__ import annotations
 
-import subprocess
+import json
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from benchkit.config import validate_config_text
+
+from .cli_runner import output_text, run_cli
+
+if TYPE_CHECKING:
+    from typer.testing import Result
+
+# Top-level commands whose --help output is checked by TestCLIHelp
+CLI_COMMANDS = [
+    "probe",
+    "setup",
+    "load",
+    "run",
+    "report",
+    "status",
+    "check",
+    "infra",
+    "cleanup",
+    "package",
+]
+
 
 @pytest.mark.e2e_dryrun
 class TestCLICheck:
@@ -22,39 +47,20 @@ class TestCLICheck:
         self, dryrun_config_path: Path, timeouts: dict[str, int]
     ) -> None:
         """Test that check command accepts valid config."""
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "check",
-                "-c",
-                str(dryrun_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["check"],
+        result = run_cli(
+            ("check", "-c", str(dryrun_config_path)), timeout=timeouts["check"]
         )
         # Check command should succeed
-        assert result.returncode == 0, f"check failed: {result.stdout}\n{result.stderr}"
+        assert result.returncode == 0, f"check failed:\n{output_text(result)}"
 
     def test_check_dump_outputs_yaml(
         self, dryrun_config_path: Path, timeouts: dict[str, int]
     ) -> None:
         """Test that check --dump outputs valid YAML config."""
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "check",
-                "-c",
-                str(dryrun_config_path),
-                "--dump",
-            ],
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            ("check", "-c", str(dryrun_config_path), "--dump"),
             timeout=timeouts["check"],
+            decode=True,
         )
         assert result.returncode == 0, f"check --dump failed: {result.stderr}"
         # Output should contain YAML config structure
@@ -65,109 +71,87 @@ class TestCLICheck:
         self, dryrun_config_path: Path, timeouts: dict[str, int]
     ) -> None:
         """Test that check --verbose shows configuration details."""
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "check",
-                "-c",
-                str(dryrun_config_path),
-                "--verbose",
-            ],
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            ("check", "-c", str(dryrun_config_path), "--verbose"),
             timeout=timeouts["check"],
         )
-        assert result.returncode == 0, f"check --verbose failed: {result.stderr}"
+        assert result.returncode == 0, f"check --verbose failed:\n{output_text(result)}"
+
+    def test_check_invalid_config_fails(self) -> None:
+        """Test that config validation rejects invalid config.
 
-    def test_check_invalid_config_fails(self, tmp_path: Path) -> None:
-        """Test that check command rejects invalid config."""
-        invalid_config = tmp_path / "invalid.yaml"
+        Validated in-process; the CLI rejection path is covered by the batched
+        check run in TestConfigValidation.
+        """
         # Empty systems list is invalid
-        invalid_config.write_text(
-            """
+        errors = validate_config_text("""
 title: "Invalid Config"
 author: "Test"
 systems: []
 workload:
   name: "tpch"
   scale_factor: 1
-"""
-        )
+""")
+        assert errors
 
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(invalid_config)],
-            capture_output=True,
-            text=True,
-        )
-        # Should fail validation
-        assert result.returncode != 0
-
-    def test_check_missing_file_fails(self, tmp_path: Path) -> None:
+    def test_check_missing_file_fails(
+        self, tmp_path: Path, timeouts: dict[str, int]
+    ) -> None:
         """Test that check command fails for missing config file."""
         missing_config = tmp_path / "nonexistent.yaml"
 
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(missing_config)],
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            ("check", "--fast", "-c", str(missing_config)), timeout=timeouts["check"]
         )
         assert result.returncode != 0
 
 
+@pytest.fixture(scope="module")
+def help_outputs() -> dict[str, Result]:
+    """Return --help results for the main app and every command in CLI_COMMANDS.
+
+    Help output is deterministic for a given benchkit version, so it is built
+    once in-process instead of spawning one interpreter per command. The main
+    app's help is stored under the "__main__" key.
+    """
+    from typer.testing import CliRunner
+
+    from benchkit.cli import app
+
+    runner = CliRunner()
+    outputs = {"__main__": runner.invoke(app, ["--help"], prog_name="benchkit")}
+    for command in CLI_COMMANDS:
+        outputs[command] = runner.invoke(app, [command, "--help"], prog_name="benchkit")
+    return outputs
+
+
 @pytest.mark.e2e_dryrun
 class TestCLIHelp:
     """Test that all CLI commands have proper help documentation."""
 
-    @pytest.mark.parametrize(
-        "command",
-        [
-            "probe",
-            "setup",
-            "load",
-            "run",
-            "report",
-            "status",
-            "check",
-            "infra",
-            "cleanup",
-            "package",
-        ],
-    )
-    def test_command_has_help(self, command: str) -> None:
+    @pytest.mark.parametrize("command", CLI_COMMANDS)
+    def test_command_has_help(
+        self, command: str, help_outputs: dict[str, Result]
+    ) -> None:
         """Test that each command provides help."""
-        result = subprocess.run(
-            ["python", "-m", "benchkit", command, "--help"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert result.returncode == 0, f"{command} --help failed: {result.stderr}"
+        result = help_outputs[command]
+        assert result.exit_code == 0, f"{command} --help failed: {result.output}"
         # Help should contain usage information
         assert "usage:" in result.stdout.lower() or "--" in result.stdout
 
-    def test_main_help(self) -> None:
+    def test_main_help(self, help_outputs: dict[str, Result]) -> None:
         """Test that main benchkit help works."""
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert result.returncode == 0, f"Main --help failed: {result.stderr}"
+        result = help_outputs["__main__"]
+        assert result.exit_code == 0, f"Main --help failed: {result.output}"
         # Should list available commands
         assert "probe" in result.stdout
         assert "run" in result.stdout
 
 
-@pytest.mark.e2e_dryrun
-class TestConfigValidation:
-    """Test configuration validation logic."""
-
-    def test_duplicate_system_names_rejected(self, tmp_path: Path) -> None:
-        """Test that duplicate system names are rejected."""
-        config_content = """
+# Config fixtures for TestConfigValidation, keyed by the case name used in
+# the batched `check --json` invocation.
+_VALIDATION_CONFIGS: dict[str, str] = {
+    "duplicate_names": """
 title: "Test"
 author: "Test"
 env:
@@ -190,21 +174,8 @@ systems:
 workload:
   name: "tpch"
   scale_factor: 1
-"""
-        config_path = tmp_path / "duplicate_names.yaml"
-        config_path.write_text(config_content)
-
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-        )
-        # Should fail due to duplicate names
-        assert result.returncode != 0
-
-    def test_invalid_system_kind_rejected(self, tmp_path: Path) -> None:
-        """Test that invalid system kinds are rejected."""
-        config_content = """
+""",
+    "invalid_kind": """
 title: "Test"
 author: "Test"
 env:
@@ -218,21 +189,8 @@ systems:
 workload:
   name: "tpch"
   scale_factor: 1
-"""
-        config_path = tmp_path / "invalid_kind.yaml"
-        config_path.write_text(config_content)
-
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-        )
-        # Should fail due to unknown kind
-        assert result.returncode != 0
-
-    def test_invalid_workload_rejected(self, tmp_path: Path) -> None:
-        """Test that invalid workload names are rejected."""
-        config_content = """
+""",
+    "invalid_workload": """
 title: "Test"
 author: "Test"
 env:
@@ -248,21 +206,8 @@ systems:
 workload:
   name: "invalid_workload"
   scale_factor: 1
-"""
-        config_path = tmp_path / "invalid_workload.yaml"
-        config_path.write_text(config_content)
-
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-        )
-        # Should fail due to unknown workload
-        assert result.returncode != 0
-
-    def test_valid_local_config_accepted(self, tmp_path: Path) -> None:
-        """Test that a valid local config is accepted."""
-        config_content = """
+""",
+    "valid_local": """
 title: "Valid Local Test"
 author: "Test"
 env:
@@ -283,23 +228,76 @@ workload:
   scale_factor: 1
   runs_per_query: 3
   warmup_runs: 1
-"""
-        config_path = tmp_path / "valid_local.yaml"
-        config_path.write_text(config_content)
+""",
+}
+
+
+@pytest.fixture(scope="module")
+def check_results(
+    tmp_path_factory: pytest.TempPathFactory, timeouts: dict[str, int]
+) -> dict[str, Any]:
+    """Validate all configs in one `check --json` run, keyed by case name."""
+    config_dir = tmp_path_factory.mktemp("config_validation")
+    paths: dict[str, str] = {}
+    args = ["check", "--json"]
+    for name, content in _VALIDATION_CONFIGS.items():
+        # Catch malformed fixtures here instead of via a failing subprocess
+        malformed = [
+            error
+            for error in validate_config_text(content)
+            if error.startswith("Invalid YAML") or "YAML mapping" in error
+        ]
+        assert not malformed, f"Malformed YAML fixture {name}: {malformed}"
+        config_path = config_dir / f"{name}.yaml"
+        config_path.write_text(content)
+        paths[str(config_path)] = name
+        args.append(str(config_path))
+
+    result = run_cli(args, timeout=timeouts["check"])
+    # Some configs are invalid, so the batch as a whole must fail
+    assert (
+        result.returncode != 0
+    ), f"check --json unexpectedly passed:\n{output_text(result)}"
+    return {paths[r["path"]]: r for r in json.loads(result.stdout)}
 
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "check", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0, f"Valid config rejected: {result.stderr}"
+
+@pytest.mark.e2e_dryrun
+class TestConfigValidation:
+    """Test configuration validation logic."""
+
+    @pytest.mark.parametrize(
+        "case",
+        ["duplicate_names", "invalid_kind", "invalid_workload"],
+    )
+    def test_invalid_config_rejected(
+        self, check_results: dict[str, Any], case: str
+    ) -> None:
+        """Test that duplicate system names, unknown kinds and workloads are rejected."""
+        assert check_results[case]["ok"] is False
+        assert check_results[case]["error"]
+
+    @pytest.mark.parametrize(
+        "case",
+        ["duplicate_names", "invalid_kind", "invalid_workload"],
+    )
+    def test_invalid_config_rejected_in_process(self, case: str) -> None:
+        """Test that in-process validation rejects the same configs as the CLI."""
+        assert validate_config_text(_VALIDATION_CONFIGS[case])
+
+    def test_valid_local_config_accepted(self, check_results: dict[str, Any]) -> None:
+        """Test that a valid local config is accepted."""
+        result = check_results["valid_local"]
+        assert result["ok"] is True, f"Valid config rejected: {result['error']}"
+        assert validate_config_text(_VALIDATION_CONFIGS["valid_local"]) == []
 
 
 @pytest.mark.e2e_dryrun
 class TestInfraCommands:
     """Test infra command validation (dry-run only)."""
 
-    def test_infra_plan_dry_run_local_mode(self, tmp_path: Path) -> None:
+    def test_infra_plan_dry_run_local_mode(
+        self, tmp_path: Path, timeouts: dict[str, int]
+    ) -> None:
         """Test that infra plan handles local mode config gracefully."""
         config_content = """
 title: "Local Mode Test"
@@ -322,32 +320,26 @@ workload:
         config_path.write_text(config_content)
 
         # infra plan on local mode should indicate no infrastructure needed
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "infra", "plan", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-            timeout=60,
+        result = run_cli(
+            ("infra", "plan", "-c", str(config_path)), timeout=timeouts["infra_plan"]
         )
         # Should succeed or gracefully indicate local mode
-        assert result.returncode == 0 or "local" in result.stdout.lower()
+        assert result.returncode == 0 or b"local" in result.stdout.lower()
 
 
 @pytest.mark.e2e_dryrun
 class TestStatusCommand:
     """Test status command validation."""
 
-    def test_status_no_config(self) -> None:
+    def test_status_no_config(self, timeouts: dict[str, int]) -> None:
         """Test that status command works without config (shows all projects)."""
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "status"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = run_cli(("status",), timeout=timeouts["status"])
         # Should succeed even with no projects
         assert result.returncode == 0
 
-    def test_status_with_nonexistent_project(self, tmp_path: Path) -> None:
+    def test_status_with_nonexistent_project(
+        self, tmp_path: Path, timeouts: dict[str, int]
+    ) -> None:
         """Test status with a config for non-existent project."""
         config_content = """
 title: "Non-existent Project Test"
@@ -369,11 +361,6 @@ workload:
         config_path = tmp_path / "nonexistent.yaml"
         config_path.write_text(config_content)
 
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "status", "-c", str(config_path)],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = run_cli(("status", "-c", str(config_path)), timeout=timeouts["status"])
         # Should succeed (just show no results)
         assert result.returncode == 0
@@ -25,7 +25,9 @@ from typing import Any
 
 import pytest
 
+from .cli_runner import output_text, run_cli
 from .verification import (
+    ResultsDirIndex,
     verify_load_complete,
     verify_query_variants,
     verify_reports_exist,
@@ -38,327 +40,143 @@ from .verification import (
 @pytest.mark.e2e
 @pytest.mark.e2e_slow
 class TestFullBenchmarkWorkflow:
-    """Test the complete benchmark workflow: infra -> setup -> load -> run -> report -> cleanup.
+    """Test the complete benchmark workflow: infra -> setup -> load -> run -> report -> cleanup."""
 
-    Tests are ordered numerically to ensure proper sequence execution.
-    Each test depends on the previous ones completing successfully.
-    """
-
-    def test_01_infra_apply(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-    ) -> None:
-        """Phase 1: Provision infrastructure.
-
-        This creates all AWS instances and managed systems defined in the config.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "infra",
-                "apply",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["infra_apply"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"infra apply failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-    def test_02_status_shows_infrastructure(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-    ) -> None:
-        """Phase 2: Verify status shows provisioned infrastructure.
-
-        After infra apply, status should show IPs and system info.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "status",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["status"],
-        )
-        assert result.returncode == 0, f"status failed: {result.stderr}"
-        # Status should mention systems
-        output_lower = result.stdout.lower()
-        assert (
-            "exasol" in output_lower or "clickhouse" in output_lower
-        ), f"Status doesn't show systems:\n{result.stdout}"
-
-    def test_03_setup(
+    def test_full_workflow(
         self,
+        subtests: pytest.Subtests,
         comprehensive_config_path: Path,
         timeouts: dict[str, int],
         results_dir: Path,
+        results_dir_index: ResultsDirIndex,
         expected_systems: list[str],
-    ) -> None:
-        """Phase 3: Install database systems.
-
-        This installs Exasol, ClickHouse on provisioned instances.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "setup",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["setup"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"setup failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify setup completion markers exist
-        verify_setup_complete(results_dir, expected_systems)
-
-    def test_04_probe(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        results_dir: Path,
-    ) -> None:
-        """Phase 4: Gather system information.
-
-        Probe collects hardware info from all systems.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "probe",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["probe"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"probe failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify system info files created
-        system_files = list(results_dir.glob("system_*.json"))
-        assert len(system_files) > 0, f"No system info files in {results_dir}"
-
-    def test_05_load(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        results_dir: Path,
-        expected_systems: list[str],
-    ) -> None:
-        """Phase 5: Load benchmark data.
-
-        This generates TPC-H data and loads it into all databases.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "load",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["load"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"load failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify load completion markers exist
-        verify_load_complete(results_dir, expected_systems)
-
-    def test_06_run(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        results_dir: Path,
         loaded_config: dict[str, Any],
-    ) -> None:
-        """Phase 6: Execute benchmark queries.
-
-        This runs TPC-H queries on all systems and collects timing data.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "run",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["run"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"run failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify runs.csv created and valid
-        verify_runs_csv(results_dir, loaded_config)
-
-        # Verify summary.json created
-        verify_summary_json(results_dir, loaded_config)
-
-        # Verify query variants used correctly
-        verify_query_variants(results_dir, loaded_config)
-
-    def test_07_status_shows_results(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        expected_systems: list[str],
-    ) -> None:
-        """Phase 7: Verify status shows completed benchmark.
-
-        After run, status should show completion and timing info.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "status",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["status"],
-        )
-        assert result.returncode == 0, f"status failed: {result.stderr}"
-
-        # Status should show system names
-        for system in expected_systems:
-            assert (
-                system in result.stdout
-            ), f"System '{system}' not in status output:\n{result.stdout}"
-
-    def test_08_report(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        results_dir: Path,
-    ) -> None:
-        """Phase 8: Generate benchmark report.
-
-        This creates markdown reports with visualizations.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "report",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["report"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"report failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify report files exist
-        verify_reports_exist(results_dir)
-
-    def test_09_package(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
-        results_dir: Path,
         project_id: str,
-    ) -> None:
-        """Phase 9: Create benchmark package.
-
-        This creates a portable zip file for reproducing the benchmark.
-        """
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "package",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["package"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"package failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-
-        # Verify package was created
-        package_patterns = [
-            results_dir / "reports" / "3-full" / f"{project_id}-workload.zip",
-            results_dir / f"{project_id}-workload.zip",
-        ]
-        package_found = any(p.exists() for p in package_patterns)
-        assert (
-            package_found
-        ), f"Package not found in expected locations: {package_patterns}"
-
-    def test_10_infra_destroy(
-        self,
-        comprehensive_config_path: Path,
-        timeouts: dict[str, int],
         skip_cleanup: bool,
     ) -> None:
-        """Phase 10: Clean up infrastructure.
+        """Run all workflow phases in order within a single test.
 
-        This destroys all provisioned resources.
+        Each phase is reported as its own subtest. Phases depend on their
+        predecessors, so the workflow stops at the first failed phase;
+        infrastructure is destroyed afterwards in any case (unless
+        --e2e-skip-cleanup is given).
         """
-        if skip_cleanup:
-            pytest.skip("Cleanup skipped via --e2e-skip-cleanup flag")
-
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "infra",
-                "destroy",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=timeouts["infra_destroy"],
-        )
-        assert (
-            result.returncode == 0
-        ), f"infra destroy failed:\nstdout: {result.stdout}\nstderr: {result.stderr}"
+        config = str(comprehensive_config_path)
+        completed: list[str] = []
+
+        def benchkit(
+            command: list[str], timeout: int
+        ) -> subprocess.CompletedProcess[str]:
+            return run_cli((*command, "-c", config), timeout=timeout, decode=True)
+
+        def require(phase: str) -> None:
+            if completed[-1:] != [phase]:
+                pytest.fail(f"Workflow stopped: phase '{phase}' failed")
+
+        try:
+            # Phase 1: Provision all AWS instances and managed systems
+            with subtests.test(msg="infra_apply"):
+                result = benchkit(["infra", "apply"], timeouts["infra_apply"])
+                assert (
+                    result.returncode == 0
+                ), f"infra apply failed:\n{output_text(result)}"
+                completed.append("infra_apply")
+            require("infra_apply")
+
+            # Phase 2: Status shows IPs and system info of the infrastructure
+            with subtests.test(msg="status_shows_infrastructure"):
+                result = benchkit(["status"], timeouts["status"])
+                assert result.returncode == 0, f"status failed: {result.stderr}"
+                output_lower = result.stdout.lower()
+                assert (
+                    "exasol" in output_lower or "clickhouse" in output_lower
+                ), f"Status doesn't show systems:\n{result.stdout}"
+                completed.append("status_shows_infrastructure")
+            require("status_shows_infrastructure")
+
+            # Phase 3: Install database systems on the provisioned instances
+            with subtests.test(msg="setup"):
+                result = benchkit(["setup"], timeouts["setup"])
+                assert result.returncode == 0, f"setup failed:\n{output_text(result)}"
+                results_dir_index.refresh()
+                verify_setup_complete(
+                    results_dir, expected_systems, results_dir_index.names
+                )
+                completed.append("setup")
+            require("setup")
+
+            # Phase 4: Collect hardware info from all systems
+            with subtests.test(msg="probe"):
+                result = benchkit(["probe"], timeouts["probe"])
+                assert result.returncode == 0, f"probe failed:\n{output_text(result)}"
+                results_dir_index.refresh()
+                assert (
+                    len(results_dir_index.system_info_files()) > 0
+                ), f"No system info files in {results_dir}"
+                completed.append("probe")
+            require("probe")
+
+            # Phase 5: Generate TPC-H data and load it into all databases
+            with subtests.test(msg="load"):
+                result = benchkit(["load"], timeouts["load"])
+                assert result.returncode == 0, f"load failed:\n{output_text(result)}"
+                results_dir_index.refresh()
+                verify_load_complete(
+                    results_dir, expected_systems, results_dir_index.names
+                )
+                completed.append("load")
+            require("load")
+
+            # Phase 6: Run the queries on all systems and collect timings
+            with subtests.test(msg="run"):
+                result = benchkit(["run"], timeouts["run"])
+                assert result.returncode == 0, f"run failed:\n{output_text(result)}"
+                runs_df = verify_runs_csv(results_dir, loaded_config)
+                verify_summary_json(results_dir, loaded_config)
+                verify_query_variants(results_dir, loaded_config, runs_df)
+                completed.append("run")
+            require("run")
+
+            # Phase 7: Status shows the completed benchmark
+            with subtests.test(msg="status_shows_results"):
+                result = benchkit(["status"], timeouts["status"])
+                assert result.returncode == 0, f"status failed: {result.stderr}"
+                for system in expected_systems:
+                    assert (
+                        system in result.stdout
+                    ), f"System '{system}' not in status output:\n{result.stdout}"
+                completed.append("status_shows_results")
+            require("status_shows_results")
+
+            # Phase 8: Generate markdown reports with visualizations
+            with subtests.test(msg="report"):
+                result = benchkit(["report"], timeouts["report"])
+                assert result.returncode == 0, f"report failed:\n{output_text(result)}"
+                verify_reports_exist(results_dir)
+                completed.append("report")
+            require("report")
+
+            # Phase 9: Create the portable zip for reproducing the benchmark
+            with subtests.test(msg="package"):
+                result = benchkit(["package"], timeouts["package"])
+                assert result.returncode == 0, f"package failed:\n{output_text(result)}"
+                package_patterns = [
+                    results_dir / "reports" / "3-full" / f"{project_id}-workload.zip",
+                    results_dir / f"{project_id}-workload.zip",
+                ]
+                assert any(
+                    p.exists() for p in package_patterns
+                ), f"Package not found in expected locations: {package_patterns}"
+                completed.append("package")
+        finally:
+            # Phase 10: Destroy all provisioned resources, including whatever a
+            # failed or interrupted infra apply left behind
+            if not skip_cleanup:
+                with subtests.test(msg="infra_destroy"):
+                    result = benchkit(["infra", "destroy"], timeouts["infra_destroy"])
+                    assert (
+                        result.returncode == 0
+                    ), f"infra destroy failed:\n{output_text(result)}"
 
 
 @pytest.mark.e2e
@@ -375,18 +193,10 @@ class TestSelectiveSystemExecution:
         if not e2e_systems:
             pytest.skip("No --e2e-systems specified")
 
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "status",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            ("status", "-c", str(comprehensive_config_path)),
             timeout=timeouts["status"],
+            decode=True,
         )
         # Verify status works and specified systems are shown
         assert result.returncode == 0
@@ -404,34 +214,19 @@ class TestInfrastructurePlan:
         timeouts: dict[str, int],
     ) -> None:
         """Test that infra plan shows what will be created."""
-        result = subprocess.run(
-            [
-                "python",
-                "-m",
-                "benchkit",
-                "infra",
-                "plan",
-                "-c",
-                str(comprehensive_config_path),
-            ],
-            capture_output=True,
-            text=True,
+        result = run_cli(
+            ("infra", "plan", "-c", str(comprehensive_config_path)),
             timeout=timeouts["infra_plan"],
         )
-        assert result.returncode == 0, f"infra plan failed: {result.stderr}"
+        assert result.returncode == 0, f"infra plan failed:\n{output_text(result)}"
 
 
 @pytest.mark.e2e
 class TestLocalExecution:
     """Test local execution mode (--local flag)."""
 
-    def test_run_local_flag_exists(self) -> None:
+    def test_run_local_flag_exists(self, timeouts: dict[str, int]) -> None:
         """Test that run command accepts --local flag."""
-        result = subprocess.run(
-            ["python", "-m", "benchkit", "run", "--help"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = run_cli(("run", "--help"), timeout=timeouts["help"], decode=True)
         assert result.returncode == 0
         assert "--local" in result.stdout or "-l" in result.stdout
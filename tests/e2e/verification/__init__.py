@@ -1,6 +1,7 @@
 """Verification functions for E2E tests."""
 
 from .verify_infrastructure import (
+    ResultsDirIndex,
     verify_infrastructure_state,
     verify_load_complete,
     verify_setup_complete,
@@ -17,6 +18,7 @@ from .verify_results import (
 )
 
 __all__ = [
+    "ResultsDirIndex",
     "verify_infrastructure_state",
     "verify_setup_complete",
     "verify_load_complete",
@@ -0,0 +1,86 @@
+"""File access shared by the E2E verification functions.
+
+JSON files are parsed from raw bytes rather than through text-mode ``open()``,
+using orjson when it is installed and the stdlib json module otherwise.
+Directory listings and per-file probes are batched so each verifier touches
+the filesystem as little as possible.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
+# Files at least this large (e.g. terraform.tfstate) are memory-mapped
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Upper bound on threads for concurrent file probes and reads; they wait on
+# I/O, not the GIL
+MAX_IO_WORKERS = 16
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file without text-mode decoding.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Parsed JSON document
+    """
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def list_names(directory: Path) -> list[str]:
+    """List file names in a directory with one scandir pass.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Entry names, or an empty list if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it]
+    except FileNotFoundError:
+        return []
+
+
+def map_concurrently(func: Callable[[_T], _R], items: Sequence[_T]) -> list[_R]:
+    """Apply an I/O-bound function to each item on a small thread pool.
+
+    A single item (or none) is handled inline, without starting a pool.
+
+    Args:
+        func: Function to apply, e.g. read_json
+        items: Inputs, typically paths
+
+    Returns:
+        Results in input order
+    """
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(items))) as pool:
+        return list(pool.map(func, items))
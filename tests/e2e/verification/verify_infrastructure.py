@@ -5,10 +5,52 @@ These functions verify that infrastructure provisioning and setup completed corr
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from .json_io import list_names, map_concurrently, read_json
+
+# Completion marker file name prefix per infrastructure phase
+_PHASE_MARKER_PREFIXES: dict[str, str] = {
+    "setup": "setup_complete_",
+    "load": "load_complete_",
+}
+
+
+class ResultsDirIndex:
+    """File names of a results directory, listed with a single scandir pass.
+
+    Call refresh() after a CLI phase has written new files; lookups between
+    refreshes do not touch the filesystem.
+    """
+
+    def __init__(self, results_dir: Path) -> None:
+        self.results_dir = results_dir
+        self.names: list[str] = []
+
+    def refresh(self) -> ResultsDirIndex:
+        """Re-list the results directory."""
+        self.names = list_names(self.results_dir)
+        return self
+
+    def matching(self, prefix: str, suffix: str = ".json") -> list[str]:
+        """Return names starting with prefix and ending with suffix."""
+        return [n for n in self.names if n.startswith(prefix) and n.endswith(suffix)]
+
+    def system_info_files(self) -> list[str]:
+        """Return probe output files (system_*.json)."""
+        return self.matching("system_")
+
+    def setup_markers(self) -> list[str]:
+        """Return setup completion markers (setup_complete_*.json)."""
+        return self.matching(_PHASE_MARKER_PREFIXES["setup"])
+
+    def load_markers(self) -> list[str]:
+        """Return load completion markers (load_complete_*.json)."""
+        return self.matching(_PHASE_MARKER_PREFIXES["load"])
+
 
 def verify_infrastructure_state(results_dir: Path, phase: str) -> None:
     """Verify that infrastructure phase completed successfully.
@@ -20,73 +62,83 @@ def verify_infrastructure_state(results_dir: Path, phase: str) -> None:
     Raises:
         AssertionError: If verification fails
     """
-    if phase == "setup":
-        pattern = "setup_complete_*.json"
-    elif phase == "load":
-        pattern = "load_complete_*.json"
-    else:
-        raise ValueError(f"Unknown phase: {phase}")
-
-    completion_files = list(results_dir.glob(pattern))
-    assert (
-        len(completion_files) > 0
-    ), f"No {phase} completion markers found in {results_dir}"
-
-    # Verify each completion marker is valid JSON
-    for completion_file in completion_files:
-        with open(completion_file) as f:
-            data = json.load(f)
-        assert (
-            "system_name" in data or "timestamp" in data
-        ), f"Invalid completion marker: {completion_file}"
+    try:
+        prefix = _PHASE_MARKER_PREFIXES[phase]
+    except KeyError:
+        raise ValueError(f"Unknown phase: {phase}") from None
 
+    completion_names = ResultsDirIndex(results_dir).refresh().matching(prefix)
+    if not completion_names:
+        raise AssertionError(f"No {phase} completion markers found in {results_dir}")
 
-def verify_setup_complete(results_dir: Path, expected_systems: list[str]) -> None:
+    # Verify each completion marker is valid JSON
+    completion_files = [results_dir / name for name in completion_names]
+    markers = map_concurrently(read_json, completion_files)
+    for completion_file, data in zip(completion_files, markers, strict=True):
+        if "system_name" not in data and "timestamp" not in data:
+            raise AssertionError(f"Invalid completion marker: {completion_file}")
+
+
+def verify_setup_complete(
+    results_dir: Path,
+    expected_systems: list[str],
+    names: Iterable[str] | None = None,
+) -> None:
     """Verify that setup completed for all expected systems.
 
     Args:
         results_dir: Results directory path
         expected_systems: List of expected system names
+        names: File names in results_dir (e.g. ResultsDirIndex.names);
+            the directory is listed once if omitted
 
     Raises:
         AssertionError: If setup verification fails
     """
-    for system in expected_systems:
-        setup_file = results_dir / f"setup_complete_{system}.json"
-        assert (
-            setup_file.exists()
-        ), f"Setup completion file not found for system '{system}': {setup_file}"
-
-        with open(setup_file) as f:
-            data = json.load(f)
-
+    existing = set(list_names(results_dir) if names is None else names)
+    setup_files = [results_dir / f"setup_complete_{s}.json" for s in expected_systems]
+    for system, setup_file in zip(expected_systems, setup_files, strict=True):
+        if setup_file.name not in existing:
+            raise AssertionError(
+                f"Setup completion file not found for system '{system}': {setup_file}"
+            )
+
+    markers = map_concurrently(read_json, setup_files)
+    for system, data in zip(expected_systems, markers, strict=True):
         # Verify timestamp exists (indicates completion)
-        assert (
-            "timestamp" in data
-        ), f"Missing timestamp in setup completion for {system}"
+        if "timestamp" not in data:
+            raise AssertionError(f"Missing timestamp in setup completion for {system}")
 
 
-def verify_load_complete(results_dir: Path, expected_systems: list[str]) -> None:
+def verify_load_complete(
+    results_dir: Path,
+    expected_systems: list[str],
+    names: Iterable[str] | None = None,
+) -> None:
     """Verify that data loading completed for all expected systems.
 
     Args:
         results_dir: Results directory path
         expected_systems: List of expected system names
+        names: File names in results_dir (e.g. ResultsDirIndex.names);
+            the directory is listed once if omitted
 
     Raises:
         AssertionError: If load verification fails
     """
-    for system in expected_systems:
-        load_file = results_dir / f"load_complete_{system}.json"
-        assert (
-            load_file.exists()
-        ), f"Load completion file not found for system '{system}': {load_file}"
-
-        with open(load_file) as f:
-            data = json.load(f)
-
+    existing = set(list_names(results_dir) if names is None else names)
+    load_files = [results_dir / f"load_complete_{s}.json" for s in expected_systems]
+    for system, load_file in zip(expected_systems, load_files, strict=True):
+        if load_file.name not in existing:
+            raise AssertionError(
+                f"Load completion file not found for system '{system}': {load_file}"
+            )
+
+    markers = map_concurrently(read_json, load_files)
+    for system, data in zip(expected_systems, markers, strict=True):
         # Verify timestamp exists
-        assert "timestamp" in data, f"Missing timestamp in load completion for {system}"
+        if "timestamp" not in data:
+            raise AssertionError(f"Missing timestamp in load completion for {system}")
 
 
 def verify_terraform_state_exists(results_dir: Path) -> dict[str, Any]:
@@ -102,15 +154,28 @@ def verify_terraform_state_exists(results_dir: Path) -> dict[str, Any]:
         AssertionError: If terraform state not found
     """
     terraform_dir = results_dir / "terraform"
-    assert terraform_dir.exists(), f"Terraform directory not found: {terraform_dir}"
+    if not terraform_dir.exists():
+        raise AssertionError(f"Terraform directory not found: {terraform_dir}")
 
     state_file = terraform_dir / "terraform.tfstate"
-    assert state_file.exists(), f"Terraform state file not found: {state_file}"
+    if not state_file.exists():
+        raise AssertionError(f"Terraform state file not found: {state_file}")
 
-    with open(state_file) as f:
-        state = json.load(f)
+    return dict(
+        _load_terraform_outputs(state_file.resolve(), state_file.stat().st_mtime_ns)
+    )
 
-    return state.get("outputs", {})
+
+@lru_cache(maxsize=4)
+def _load_terraform_outputs(state_file: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse terraform state outputs, cached per file and modification time.
+
+    State files can be several MB; the mtime key makes sure a re-applied
+    state is parsed again while repeated lookups within a session are free.
+    """
+    state = read_json(state_file)
+    outputs: dict[str, Any] = state.get("outputs", {})
+    return outputs
 
 
 def verify_system_ips_available(
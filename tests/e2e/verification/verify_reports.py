@@ -5,9 +5,46 @@ These functions verify that benchmark reports are generated correctly.
 
 from __future__ import annotations
 
+import os
+import re
 import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 
+from .json_io import map_concurrently
+
+# Report variants, figures and attachments the verifiers look for
+_EXPECTED_VARIANTS = ("1-short", "2-results", "3-full")
+_EXPECTED_FIGURES = (
+    "query_runtime_boxplot.png",
+    "median_runtime_bar.png",
+    "performance_heatmap.png",
+)
+_EXPECTED_ATTACHMENTS = ("config.yaml", "summary.json")
+
+# Substrings at least one package member name must contain, matched in one scan
+_REQUIRED_PKG_PATTERNS = (
+    "run_benchmark.sh",
+    "config.yaml",
+    "benchkit/",
+    "requirements.txt",
+)
+_REQUIRED_PKG_RE = re.compile("|".join(map(re.escape, _REQUIRED_PKG_PATTERNS)))
+
+
+def _size_or_none(path: str | os.PathLike[str]) -> int | None:
+    """Return the size of ``path`` from a single stat, or None if it is missing."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
+def _scan_dirs(path: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield the subdirectories of ``path`` using cached scandir metadata."""
+    with os.scandir(path) as it:
+        yield from (e for e in it if e.is_dir(follow_symlinks=False))
+
 
 def verify_reports_exist(results_dir: Path) -> None:
     """Verify that report was generated correctly.
@@ -25,32 +62,42 @@ def verify_reports_exist(results_dir: Path) -> None:
         AssertionError: If report verification fails
     """
     reports_dir = results_dir / "reports"
-    assert reports_dir.exists(), f"Reports directory not found: {reports_dir}"
+    if not reports_dir.exists():
+        raise AssertionError(f"Reports directory not found: {reports_dir}")
 
     # Check for report variants
-    expected_variants = ["1-short", "2-results", "3-full"]
     found_variants = []
 
-    for variant in expected_variants:
-        variant_dir = reports_dir / variant
-        if not variant_dir.exists():
-            # Not all variants are always generated, track which exist
-            continue
+    report_paths = [
+        os.path.join(reports_dir, variant, "REPORT.md")
+        for variant in _EXPECTED_VARIANTS
+    ]
+    sizes = map_concurrently(_size_or_none, report_paths)
 
-        found_variants.append(variant)
+    for variant, report_path, report_size in zip(
+        _EXPECTED_VARIANTS, report_paths, sizes, strict=True
+    ):
+        variant_dir = os.path.dirname(report_path)
 
         # Check for REPORT.md
-        report_md = variant_dir / "REPORT.md"
-        assert report_md.exists(), f"REPORT.md not found in {variant_dir}"
+        if report_size is None:
+            if not os.path.isdir(variant_dir):
+                # Not all variants are always generated, track which exist
+                continue
+            raise AssertionError(f"REPORT.md not found in {variant_dir}")
+
+        found_variants.append(variant)
 
         # Verify REPORT.md is not empty
-        assert report_md.stat().st_size > 0, f"REPORT.md is empty in {variant_dir}"
+        if report_size == 0:
+            raise AssertionError(f"REPORT.md is empty in {variant_dir}")
 
     # At least one variant should exist
-    assert len(found_variants) > 0, (
-        f"No report variants found in {reports_dir}. "
-        f"Expected one of: {expected_variants}"
-    )
+    if not found_variants:
+        raise AssertionError(
+            f"No report variants found in {reports_dir}. "
+            f"Expected one of: {list(_EXPECTED_VARIANTS)}"
+        )
 
 
 def verify_figures_generated(results_dir: Path) -> None:
@@ -73,25 +120,23 @@ def verify_figures_generated(results_dir: Path) -> None:
         # Figures are optional, skip if not found
         return
 
-    expected_figures = [
-        "query_runtime_boxplot.png",
-        "median_runtime_bar.png",
-        "performance_heatmap.png",
-    ]
+    figure_paths = [figures_dir / figure for figure in _EXPECTED_FIGURES]
+    sizes = map_concurrently(_size_or_none, figure_paths)
 
     found_figures = []
-    for figure in expected_figures:
-        figure_path = figures_dir / figure
-        if figure_path.exists():
+    for figure, figure_path, size in zip(
+        _EXPECTED_FIGURES, figure_paths, sizes, strict=True
+    ):
+        if size is not None:
             found_figures.append(figure)
-            assert (
-                figure_path.stat().st_size > 0
-            ), f"Figure file is empty: {figure_path}"
+            if size == 0:
+                raise AssertionError(f"Figure file is empty: {figure_path}")
 
     # At least some figures should be generated
-    assert (
-        len(found_figures) > 0
-    ), f"No figures found in {figures_dir}. Expected: {expected_figures}"
+    if not found_figures:
+        raise AssertionError(
+            f"No figures found in {figures_dir}. Expected: {list(_EXPECTED_FIGURES)}"
+        )
 
 
 def verify_package_contents(package_path: Path) -> None:
@@ -103,32 +148,31 @@ def verify_package_contents(package_path: Path) -> None:
     Raises:
         AssertionError: If package verification fails
     """
-    assert package_path.exists(), f"Package not found: {package_path}"
-    assert package_path.stat().st_size > 0, f"Package is empty: {package_path}"
-
+    package_size = _size_or_none(package_path)
+    if package_size is None:
+        raise AssertionError(f"Package not found: {package_path}")
+    if package_size == 0:
+        raise AssertionError(f"Package is empty: {package_path}")
+
+    # ZipFile only parses the central directory on open; member data and CRCs
+    # are never read (no testzip()), so the archive is closed right after
+    # taking the name list and both checks below share that single list.
     with zipfile.ZipFile(package_path, "r") as zf:
         file_list = zf.namelist()
 
-        # Check for required files
-        required_patterns = [
-            "run_benchmark.sh",
-            "config.yaml",
-            "benchkit/",
-            "requirements.txt",
-        ]
-
-        for pattern in required_patterns:
-            matches = [f for f in file_list if pattern in f]
-            assert len(matches) > 0, (
+    # Check for required files with one regex scan over all names
+    found = set(_REQUIRED_PKG_RE.findall("\n".join(file_list)))
+    for pattern in _REQUIRED_PKG_PATTERNS:
+        if pattern not in found:
+            raise AssertionError(
                 f"Required pattern '{pattern}' not found in package. "
                 f"Files: {file_list[:20]}..."  # Show first 20 files
             )
 
-        # Verify package doesn't include infra/ (should be excluded)
-        infra_files = [f for f in file_list if ".tf" in f or "terraform/" in f]
-        assert (
-            len(infra_files) == 0
-        ), f"infra/ files should not be in package: {infra_files}"
+    # Verify package doesn't include infra/ (should be excluded)
+    infra_files = [f for f in file_list if ".tf" in f or "terraform/" in f]
+    if infra_files:
+        raise AssertionError(f"infra/ files should not be in package: {infra_files}")
 
 
 def verify_report_attachments(results_dir: Path) -> None:
@@ -154,17 +198,12 @@ def verify_report_attachments(results_dir: Path) -> None:
         return
 
     # Check for common attachments
-    expected_attachments = [
-        "config.yaml",
-        "summary.json",
-    ]
-
-    for attachment in expected_attachments:
-        attachment_path = attachments / attachment
-        if attachment_path.exists():
-            assert (
-                attachment_path.stat().st_size > 0
-            ), f"Attachment is empty: {attachment_path}"
+    attachment_paths = [attachments / name for name in _EXPECTED_ATTACHMENTS]
+    sizes = map_concurrently(_size_or_none, attachment_paths)
+    for attachment_path, size in zip(attachment_paths, sizes, strict=True):
+        # Missing attachments are tolerated; present ones must not be empty
+        if size == 0:
+            raise AssertionError(f"Attachment is empty: {attachment_path}")
 
 
 def verify_html_report_generated(results_dir: Path) -> None:
@@ -182,14 +221,14 @@ def verify_html_report_generated(results_dir: Path) -> None:
 
     # Check for HTML files in report variants
     html_found = False
-    for variant_dir in reports_dir.iterdir():
-        if variant_dir.is_dir():
-            html_file = variant_dir / "REPORT.html"
-            if html_file.exists():
-                html_found = True
-                assert (
-                    html_file.stat().st_size > 0
-                ), f"HTML report is empty: {html_file}"
+    for entry in _scan_dirs(reports_dir):
+        html_file = os.path.join(entry.path, "REPORT.html")
+        size = _size_or_none(html_file)
+        if size is None:
+            continue
+        html_found = True
+        if size == 0:
+            raise AssertionError(f"HTML report is empty: {html_file}")
 
     # HTML reports are optional, just note if not found
     if not html_found:
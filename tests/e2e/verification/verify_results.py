@@ -5,12 +5,54 @@ These functions verify that benchmark results are correct and complete.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
+from .json_io import list_names, map_concurrently, read_json
+
+# Columns verify_runs_csv requires; anything else in runs.csv is not parsed
+_RUNS_COLUMNS = (
+    "system",
+    "query",
+    "run",
+    "elapsed_s",
+    "elapsed_ms",
+    "success",
+    "workload",
+    "scale_factor",
+    "variant",
+)
+
+# The low-cardinality label columns are categorical so comparisons and
+# unique() work on int codes
+_RUNS_DTYPES = {
+    "system": "category",
+    "query": "category",
+    "variant": "category",
+    "workload": "category",
+}
+
+
+def _system_names(config: dict[str, Any]) -> list[str]:
+    """Return the configured system names in declaration order."""
+    return [system["name"] for system in config["systems"]]
+
+
+def _read_runs_csv(runs_csv: Path) -> pd.DataFrame:
+    """Parse the columns of runs.csv the verifiers need.
+
+    Missing columns are tolerated here so the caller can report them.
+    """
+    return pd.read_csv(
+        runs_csv,
+        engine="c",
+        usecols=lambda col: col in _RUNS_COLUMNS,
+        dtype=_RUNS_DTYPES,
+        low_memory=False,
+    )
+
 
 def verify_runs_csv(results_dir: Path, config: dict[str, Any]) -> pd.DataFrame:
     """Verify runs.csv exists and has correct structure.
@@ -26,52 +68,45 @@ def verify_runs_csv(results_dir: Path, config: dict[str, Any]) -> pd.DataFrame:
         AssertionError: If verification fails
     """
     runs_csv = results_dir / "runs.csv"
-    assert runs_csv.exists(), f"runs.csv not found at {runs_csv}"
+    if not runs_csv.exists():
+        raise AssertionError(f"runs.csv not found at {runs_csv}")
 
-    df = pd.read_csv(runs_csv)
+    df = _read_runs_csv(runs_csv)
 
     # Verify required columns exist
-    required_columns = [
-        "system",
-        "query",
-        "run",
-        "elapsed_s",
-        "elapsed_ms",
-        "success",
-        "workload",
-        "scale_factor",
-        "variant",
-    ]
-    for col in required_columns:
-        assert col in df.columns, f"Missing required column '{col}' in runs.csv"
+    for col in _RUNS_COLUMNS:
+        if col not in df.columns:
+            raise AssertionError(f"Missing required column '{col}' in runs.csv")
 
     # Verify all systems are present
-    systems_in_config = [s["name"] for s in config["systems"]]
+    systems_in_config = _system_names(config)
     systems_in_results = df["system"].unique().tolist()
 
-    for system in systems_in_config:
-        assert system in systems_in_results, (
-            f"System '{system}' not found in results. "
+    missing = set(systems_in_config) - set(systems_in_results)
+    if missing:
+        raise AssertionError(
+            f"Systems {sorted(missing)} not found in results. "
             f"Found systems: {systems_in_results}"
         )
 
-    # Verify correct number of runs per query
+    # Verify correct number of runs per query, counted in one groupby
     runs_per_query = config["workload"]["runs_per_query"]
-    for system in systems_in_config:
-        system_df = df[df["system"] == system]
-        for query in system_df["query"].unique():
-            query_runs = len(system_df[system_df["query"] == query])
-            assert query_runs == runs_per_query, (
-                f"Expected {runs_per_query} runs for {system}/{query}, "
-                f"got {query_runs}"
-            )
+    counts = df.groupby(["system", "query"], sort=False, observed=True).size()
+    counts = counts[counts.index.get_level_values("system").isin(systems_in_config)]
+    wrong = counts[counts != runs_per_query]
+    if not wrong.empty:
+        details = ", ".join(
+            f"{system}/{query}: {n}" for (system, query), n in wrong.items()
+        )
+        raise AssertionError(f"Expected {runs_per_query} runs per query, got {details}")
 
     # Verify success rate (at least 80% should succeed for E2E test)
-    success_rate = df["success"].mean()
-    assert success_rate >= 0.8, (
-        f"Success rate too low: {success_rate:.1%}. "
-        f"Check query failures in results."
-    )
+    success_rate = float(df["success"].to_numpy(dtype=bool).mean())
+    if not success_rate >= 0.8:
+        raise AssertionError(
+            f"Success rate too low: {success_rate:.1%}. "
+            f"Check query failures in results."
+        )
 
     return df
 
@@ -90,65 +125,81 @@ def verify_summary_json(results_dir: Path, config: dict[str, Any]) -> dict[str,
         AssertionError: If verification fails
     """
     summary_path = results_dir / "summary.json"
-    assert summary_path.exists(), f"summary.json not found at {summary_path}"
+    if not summary_path.exists():
+        raise AssertionError(f"summary.json not found at {summary_path}")
 
-    with open(summary_path) as f:
-        summary = json.load(f)
+    summary = read_json(summary_path)
 
     # Verify required keys
     required_keys = ["systems", "query_names", "per_system", "per_query"]
     for key in required_keys:
-        assert key in summary, f"Missing '{key}' in summary.json"
-
-    # Verify all systems are present
-    systems_in_config = [s["name"] for s in config["systems"]]
-    for system in systems_in_config:
-        assert (
-            system in summary["systems"]
-        ), f"System '{system}' not in summary.json systems list"
-        assert (
-            system in summary["per_system"]
-        ), f"System '{system}' not in per_system stats"
-
-    # Verify statistics are present and positive
-    for system in systems_in_config:
-        stats = summary["per_system"][system]
-        assert "avg_runtime_ms" in stats, f"Missing avg_runtime_ms for {system}"
-        assert "median_runtime_ms" in stats, f"Missing median_runtime_ms for {system}"
-        assert (
-            stats["avg_runtime_ms"] > 0
-        ), f"Invalid avg_runtime_ms for {system}: {stats['avg_runtime_ms']}"
+        if key not in summary:
+            raise AssertionError(f"Missing '{key}' in summary.json")
+
+    # Verify all systems are present with positive statistics, in one pass
+    summary_systems = set(summary["systems"])
+    per_system = summary["per_system"]
+    for system in _system_names(config):
+        if system not in summary_systems:
+            raise AssertionError(f"System '{system}' not in summary.json systems list")
+        stats = per_system.get(system)
+        if stats is None:
+            raise AssertionError(f"System '{system}' not in per_system stats")
+        if "avg_runtime_ms" not in stats:
+            raise AssertionError(f"Missing avg_runtime_ms for {system}")
+        if "median_runtime_ms" not in stats:
+            raise AssertionError(f"Missing median_runtime_ms for {system}")
+        if not stats["avg_runtime_ms"] > 0:
+            raise AssertionError(
+                f"Invalid avg_runtime_ms for {system}: {stats['avg_runtime_ms']}"
+            )
 
     return summary
 
 
-def verify_query_variants(results_dir: Path, config: dict[str, Any]) -> None:
+def verify_query_variants(
+    results_dir: Path, config: dict[str, Any], df: pd.DataFrame | None = None
+) -> None:
     """Verify that correct query variants were used for each system.
 
     Args:
         results_dir: Results directory
         config: Benchmark configuration
+        df: runs.csv as returned by verify_runs_csv; read from disk if None
 
     Raises:
         AssertionError: If variant verification fails
     """
-    runs_csv = results_dir / "runs.csv"
-    df = pd.read_csv(runs_csv)
+    if df is None:
+        df = _read_runs_csv(results_dir / "runs.csv")
 
     system_variants = config["workload"].get("system_variants", {})
     default_variant = config["workload"].get("variant", "official")
 
-    for system in df["system"].unique():
-        expected_variant = system_variants.get(system, default_variant)
-        actual_variants = df[df["system"] == system]["variant"].unique()
-
-        assert (
-            len(actual_variants) == 1
-        ), f"Multiple variants found for {system}: {actual_variants.tolist()}"
-        assert actual_variants[0] == expected_variant, (
-            f"Wrong variant for {system}: "
-            f"expected '{expected_variant}', got '{actual_variants[0]}'"
-        )
+    # One groupby over all systems instead of a boolean mask per system
+    variants = df.groupby("system", sort=False, observed=True)["variant"]
+
+    variant_counts = variants.nunique()
+    mixed = variant_counts[variant_counts != 1]
+    if not mixed.empty:
+        details = {
+            system: variants.get_group(system).unique().tolist()
+            for system in mixed.index
+        }
+        raise AssertionError(f"Multiple variants found per system: {details}")
+
+    actual = variants.first()
+    expected = pd.Series(
+        [system_variants.get(system, default_variant) for system in actual.index],
+        index=actual.index,
+    )
+    wrong = actual[actual.astype(object) != expected]
+    if not wrong.empty:
+        details = {
+            system: f"expected '{expected[system]}', got '{variant}'"
+            for system, variant in wrong.items()
+        }
+        raise AssertionError(f"Wrong variant for systems: {details}")
 
 
 def verify_data_loaded(results_dir: Path, config: dict[str, Any]) -> None:
@@ -163,17 +214,21 @@ def verify_data_loaded(results_dir: Path, config: dict[str, Any]) -> None:
     Raises:
         AssertionError: If data loading verification fails
     """
-    systems_in_config = [s["name"] for s in config["systems"]]
-
-    for system in systems_in_config:
-        load_file = results_dir / f"load_complete_{system}.json"
-        assert load_file.exists(), f"Load completion file not found for {system}"
-
-        with open(load_file) as f:
-            load_data = json.load(f)
-
+    systems_in_config = _system_names(config)
+
+    # One directory listing for all existence checks
+    existing = set(list_names(results_dir))
+    load_files = [results_dir / f"load_complete_{s}.json" for s in systems_in_config]
+    for system, load_file in zip(systems_in_config, load_files, strict=True):
+        if load_file.name not in existing:
+            raise AssertionError(f"Load completion file not found for {system}")
+
+    # Parse all markers concurrently
+    markers = map_concurrently(read_json, load_files)
+    for system, load_data in zip(systems_in_config, markers, strict=True):
         # Verify timestamp exists (indicates completion)
-        assert "timestamp" in load_data, f"Missing timestamp in load data for {system}"
+        if "timestamp" not in load_data:
+            raise AssertionError(f"Missing timestamp in load data for {system}")
 
 
 def verify_error_messages(results_dir: Path) -> list[str]:
@@ -189,11 +244,13 @@ def verify_error_messages(results_dir: Path) -> list[str]:
     if not runs_csv.exists():
         return []
 
-    df = pd.read_csv(runs_csv)
-    failed = df[df["success"] == False]  # noqa: E712
-
-    errors = []
-    if "error" in failed.columns:
-        errors = failed["error"].dropna().unique().tolist()
+    df = pd.read_csv(
+        runs_csv, engine="c", usecols=lambda col: col in ("success", "error")
+    )
+    if "error" not in df.columns:
+        return []
 
-    return errors
+    # Mask the single error column rather than copying every failed row
+    failed = ~df["success"].to_numpy(dtype=bool)
+    errors: list[str] = pd.unique(df["error"].to_numpy()[failed]).tolist()
+    return [e for e in errors if isinstance(e, str)]
@@ -1,12 +1,26 @@
 """Tests for AST-based code minimizer."""
 
 import ast
-import tempfile
-from pathlib import Path
+import copy
+import functools
 
 from benchkit.package.code_minimizer import CodeMinimizer, ExclusionTransformer
 
 
+@functools.lru_cache(maxsize=64)
+def _parse(code: str) -> ast.Module:
+    """Parse a snippet once per session; callers must not mutate the result."""
+    return ast.parse(code)
+
+
+def _transform(code: str) -> tuple[ast.Module, ExclusionTransformer]:
+    """Run ExclusionTransformer over a private copy of the parsed snippet."""
+    transformer = ExclusionTransformer()
+    # The transformer rewrites nodes in place, so never hand it the cached tree
+    result = transformer.visit(copy.deepcopy(_parse(code)))
+    return result, transformer
+
+
 def test_excludes_marked_methods():
     """Test that @exclude_from_package methods are removed."""
     code = """
@@ -25,9 +39,7 @@ class TestSystem:
     def setup_storage(self):
         pass
 """
-    tree = ast.parse(code)
-    transformer = ExclusionTransformer()
-    result = transformer.visit(tree)
+    result, transformer = _transform(code)
 
     # Check that install() and setup_storage() were removed
     class_node = result.body[1]  # TestSystem class (after import)
@@ -49,9 +61,7 @@ class TestSystem:
     def execute_query(self):
         return "test"
 """
-    tree = ast.parse(code)
-    transformer = ExclusionTransformer()
-    result = transformer.visit(tree)
+    result, transformer = _transform(code)
 
     # Check that @workload_only decorator was removed
     class_node = result.body[1]  # TestSystem class
@@ -60,7 +70,7 @@ class TestSystem:
     assert len(execute_query.decorator_list) == 0
 
 
-def test_minimizer_reduces_file():
+def test_minimizer_reduces_file(tmp_path):
     """Test that minimizer reduces file size."""
     code = '''
 from benchkit.package.markers import exclude_from_package, workload_only
@@ -82,22 +92,21 @@ class TestSystem:
         pass
 '''
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_file = Path(tmpdir) / "test.py"
-        test_file.write_text(code)
+    test_file = tmp_path / "test.py"
+    test_file.write_text(code)
 
-        minimizer = CodeMinimizer(Path(tmpdir))
-        minimized = minimizer.minimize_file(test_file)
+    minimizer = CodeMinimizer(tmp_path)
+    minimized = minimizer.minimize_file(test_file)
 
-        # Verify exclusions
-        assert "needed_method" in minimized
-        assert "not_needed_method" not in minimized
-        assert "another_excluded" not in minimized
+    # Verify exclusions
+    assert "needed_method" in minimized
+    assert "not_needed_method" not in minimized
+    assert "another_excluded" not in minimized
 
-        # Verify markers removed
-        assert "@workload_only" not in minimized
-        assert "@exclude_from_package" not in minimized
-        assert "from benchkit.package.markers import" not in minimized
+    # Verify markers removed
+    assert "@workload_only" not in minimized
+    assert "@exclude_from_package" not in minimized
+    assert "from benchkit.package.markers import" not in minimized
 
 
 def test_preserves_other_decorators():
@@ -116,9 +125,7 @@ class TestSystem:
     def class_method(cls):
         pass
 """
-    tree = ast.parse(code)
-    transformer = ExclusionTransformer()
-    result = transformer.visit(tree)
+    result, transformer = _transform(code)
 
     class_node = result.body[1]
 
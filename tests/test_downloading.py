@@ -1,3 +1,4 @@
+import hashlib
 from pathlib import Path
 
 # noinspection PyUnusedImports
@@ -7,11 +8,15 @@ from requests.exceptions import ConnectionError, HTTPError, MissingSchema
 from benchkit.common import download_file_to_storage
 
 
-def get_temp_file_name() -> Path:
-    import tempfile
-
-    with tempfile.NamedTemporaryFile() as f:
-        return Path(f.name)
+def sha256_hexdigest(path: Path, buf_size: int = 1 << 20) -> str:
+    """Hash a downloaded file in large chunks, reusing one read buffer."""
+    digest = hashlib.sha256()
+    buffer = bytearray(buf_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while read := file.readinto(buffer):
+            digest.update(view[:read])
+    return digest.hexdigest()
 
 
 def test_bad_url(tmp_path):
@@ -43,23 +48,15 @@ def test_no_access(tmp_path):
     assert "403" in str(e.value)
 
 
-def test_good_file():
-    from hashlib import file_digest
-
-    target: Path = get_temp_file_name()
+def test_good_file(tmp_path):
+    target: Path = tmp_path / "download.bin"
     assert not target.exists()
-    try:
-        download_file_to_storage(
-            "https://github.githubassets.com/favicons/favicon.png", target
-        )
-        assert target.exists()
-        assert target.stat().st_size == 958
-        with open(target, "rb") as file:
-            x = file_digest(file, "sha256")
-            assert (
-                x.hexdigest()
-                == "74cf90ac2fe6624ab1056cacea11cf7ed4f8bef54bbb0e869638013bba45bc08"
-            )
-
-    finally:
-        target.unlink(missing_ok=True)
+    download_file_to_storage(
+        "https://github.githubassets.com/favicons/favicon.png", target
+    )
+    assert target.exists()
+    assert target.stat().st_size == 958
+    assert (
+        sha256_hexdigest(target)
+        == "74cf90ac2fe6624ab1056cacea11cf7ed4f8bef54bbb0e869638013bba45bc08"
+    )
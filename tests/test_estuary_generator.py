@@ -14,25 +14,26 @@ def test_supplier():
 
     # override default settings
     generator.total_rows = 100
-    generated_rows: int = 0
+    rows: list[list] = []
     last_row_time = time()
 
-    max_length: list[int] = [0] * 10
-
     for row in generator.rows():
         next_row_time = time()
         assert (
             next_row_time - last_row_time <= 1.0
         ), "Batches must not delay more than a second"
         last_row_time = next_row_time
-        assert isinstance(row[0], int), "Column zero must be integer"
-        generated_rows += 1
+        rows.append(row)
 
-        for col, value in enumerate(row):
-            if isinstance(value, str):
-                max_length[col] = max(max_length[col], len(value))
+    assert len(rows) == 100, "Must produce the expected number of rows"
+    assert all(isinstance(row[0], int) for row in rows), "Column zero must be integer"
 
-    assert generated_rows == 100, "Must produce the expected number of rows"
+    # per-column maximum string length, computed column-wise over all rows
+    max_length: list[int] = [
+        max((len(v) for v in column if isinstance(v, str)), default=0)
+        for column in zip(*rows, strict=True)
+    ]
+    max_length += [0] * (10 - len(max_length))
     assert (
         last_row_time - generator_construction_timer <= 10.0
     ), "100 rows must be done in less than 10 seconds"
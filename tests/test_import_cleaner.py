@@ -1,9 +1,17 @@
 """Tests for import cleaner - handles TYPE_CHECKING blocks and unused imports."""
 
+import pytest
+
 from benchkit.package.import_cleaner import ImportCleaner
 
 
-def test_empty_type_checking_block_removed():
+@pytest.fixture(scope="module")
+def cleaner() -> ImportCleaner:
+    """One cleaner for the module; ImportCleaner keeps no per-source state."""
+    return ImportCleaner()
+
+
+def test_empty_type_checking_block_removed(cleaner: ImportCleaner) -> None:
     """Test that empty TYPE_CHECKING blocks are removed entirely."""
     code = """
 from typing import TYPE_CHECKING
@@ -14,7 +22,6 @@ if TYPE_CHECKING:
 def hello():
     pass
 """
-    cleaner = ImportCleaner()
     cleaned = cleaner._clean_source(code)
 
     # TYPE_CHECKING block and import should be gone
@@ -24,7 +31,7 @@ def hello():
     assert "def hello" in cleaned
 
 
-def test_type_checking_with_used_import_preserved():
+def test_type_checking_with_used_import_preserved(cleaner: ImportCleaner) -> None:
     """Test that TYPE_CHECKING blocks with used imports are kept."""
     code = """
 from typing import TYPE_CHECKING
@@ -35,7 +42,6 @@ if TYPE_CHECKING:
 def hello(x: Bar) -> None:
     pass
 """
-    cleaner = ImportCleaner()
     cleaned = cleaner._clean_source(code)
 
     # TYPE_CHECKING block should remain since Bar is used in type hint
@@ -44,7 +50,7 @@ def hello(x: Bar) -> None:
     assert "def hello" in cleaned
 
 
-def test_partial_type_checking_cleanup():
+def test_partial_type_checking_cleanup(cleaner: ImportCleaner) -> None:
     """Test that only unused imports in TYPE_CHECKING are removed."""
     code = """
 from typing import TYPE_CHECKING
@@ -55,7 +61,6 @@ if TYPE_CHECKING:
 def hello(x: Used) -> None:
     pass
 """
-    cleaner = ImportCleaner()
     cleaned = cleaner._clean_source(code)
 
     # TYPE_CHECKING block should remain with Used, but Unused removed
@@ -64,7 +69,7 @@ def hello(x: Used) -> None:
     assert "Unused" not in cleaned
 
 
-def test_regular_unused_imports_removed():
+def test_regular_unused_imports_removed(cleaner: ImportCleaner) -> None:
     """Test that regular unused imports are still removed."""
     code = """
 import os
@@ -73,7 +78,6 @@ import sys
 def hello():
     return sys.version
 """
-    cleaner = ImportCleaner()
     cleaned = cleaner._clean_source(code)
 
     # os is unused, sys is used
@@ -81,7 +85,7 @@ def hello():
     assert "sys" in cleaned
 
 
-def test_cascading_cleanup():
+def test_cascading_cleanup(cleaner: ImportCleaner) -> None:
     """Test that multi-pass cleanup works for cascading removals."""
     code = """
 from typing import TYPE_CHECKING, Optional
@@ -92,7 +96,6 @@ if TYPE_CHECKING:
 def hello():
     pass
 """
-    cleaner = ImportCleaner()
     cleaned = cleaner._clean_source(code)
 
     # TYPE_CHECKING is unused after block removal
@@ -2,19 +2,11 @@
 
 from __future__ import annotations
 
-import importlib.util
-from pathlib import Path
+import threading
+import time
 
-MODULE_PATH = (
-    Path(__file__).resolve().parents[1] / "benchkit" / "run" / "parallel_executor.py"
-)
-spec = importlib.util.spec_from_file_location(
-    "benchkit.run.parallel_executor", MODULE_PATH
-)
-module = importlib.util.module_from_spec(spec)
-assert spec.loader is not None
-spec.loader.exec_module(module)
-ParallelExecutor = module.ParallelExecutor
+from benchkit.run.file_logger import FileLogger
+from benchkit.run.parallel_executor import ParallelExecutor
 
 
 def test_parallel_executor_basic_execution(tmp_path):
@@ -120,6 +112,23 @@ def test_parallel_executor_callback_routing(tmp_path):
     assert "MESSAGE_alpha_0" not in beta_log
 
 
+def test_parallel_executor_callback_coerces_to_str(tmp_path):
+    """Test that non-string callback messages are logged, not dropped."""
+    executor = ParallelExecutor(max_workers=1)
+
+    def task():
+        callback = executor.create_output_callback("test")
+        callback(12345)
+        return "result"
+
+    results = executor.execute_parallel(
+        {"test": task}, "Coerce Phase", log_dir=tmp_path
+    )
+
+    assert results["test"] == "result"
+    assert "12345" in (tmp_path / "coerce-phase" / "test.log").read_text()
+
+
 def test_parallel_executor_no_log_dir():
     """Test execution without log directory."""
     executor = ParallelExecutor(max_workers=1)
@@ -136,6 +145,38 @@ def test_parallel_executor_no_log_dir():
     assert results["test"] == "result"
 
 
+def test_parallel_executor_no_log_dir_drops_output():
+    """Test that output is not buffered when there is no log directory."""
+    executor = ParallelExecutor(max_workers=1)
+
+    def task():
+        for i in range(100):
+            executor.add_output("test", f"line {i}")
+        return "result"
+
+    executor.execute_parallel({"test": task}, "No Log Phase", log_dir=None)
+
+    assert executor._buffers == {}
+
+
+def test_parallel_executor_log_write_error_fails_task(tmp_path, monkeypatch):
+    """Test that a task whose log cannot be written is marked failed."""
+    executor = ParallelExecutor(max_workers=2)
+
+    def write_lines(self, lines):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(FileLogger, "write_lines", write_lines)
+
+    results = executor.execute_parallel(
+        {"test": lambda: "result"}, "Broken Log Phase", log_dir=tmp_path
+    )
+
+    assert results["test"] is None
+    assert executor.status["test"].startswith("Failed: log write error")
+    assert "disk full" in executor.status["test"]
+
+
 def test_parallel_executor_empty_tasks():
     """Test with empty tasks dict."""
     executor = ParallelExecutor(max_workers=1)
@@ -157,3 +198,66 @@ def test_parallel_executor_status_tracking(tmp_path):
     assert executor.status["test"] == "Completed"
     assert "test" in executor.finish_times
     assert "test" in executor.start_times
+
+
+def test_parallel_executor_shared_pool_respects_max_workers(tmp_path):
+    """Test that executors share one pool but never exceed their max_workers."""
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def task():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return "done"
+
+    tasks = {f"task-{i}": task for i in range(6)}
+
+    first = ParallelExecutor(max_workers=2)
+    first.execute_parallel(tasks, "Pool Phase", log_dir=None)
+    pool = ParallelExecutor._shared_pool
+
+    second = ParallelExecutor(max_workers=2)
+    results = second.execute_parallel(tasks, "Pool Phase", log_dir=None)
+
+    assert all(r == "done" for r in results.values())
+    assert peak <= 2
+    assert ParallelExecutor._shared_pool is pool
+
+
+def test_parallel_executor_concurrent_runs_grow_shared_pool():
+    """Test that a run keeps working when a concurrent run replaces the pool."""
+    ParallelExecutor.shutdown_shared()
+    workers = ParallelExecutor.SHARED_POOL_MIN_WORKERS
+    second_started = threading.Event()
+    results: dict[str, dict[str, object]] = {}
+
+    def first_task():
+        # Hold the first run's workers until the second run has grown the pool
+        second_started.wait(5)
+        return "first"
+
+    def second_task():
+        second_started.set()
+        return "second"
+
+    def run(label, task):
+        executor = ParallelExecutor(max_workers=workers)
+        tasks = {f"{label}-{i}": task for i in range(2 * workers)}
+        results[label] = executor.execute_parallel(tasks, label, log_dir=None)
+
+    first = threading.Thread(target=run, args=("first", first_task))
+    first.start()
+    while ParallelExecutor._shared_pool_demand < workers:
+        time.sleep(0.001)
+    run("second", second_task)
+    first.join()
+
+    assert set(results["first"].values()) == {"first"}
+    assert set(results["second"].values()) == {"second"}
+    assert ParallelExecutor._pool_users == {}
@@ -17,75 +17,153 @@ This approach avoids the race conditions inherent in redirect_stdout.
 
 from __future__ import annotations
 
-import importlib.util
+import io
+import mmap
+import re
 import threading
-from collections.abc import Callable
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import pytest
+from rich.console import Console
 
-# Import ParallelExecutor from the module
-MODULE_PATH = (
-    Path(__file__).resolve().parents[1] / "benchkit" / "run" / "parallel_executor.py"
-)
-spec = importlib.util.spec_from_file_location(
-    "benchkit.run.parallel_executor", MODULE_PATH
-)
-module = importlib.util.module_from_spec(spec)
-assert spec.loader is not None
-spec.loader.exec_module(module)
-ParallelExecutor = module.ParallelExecutor
+from benchkit.run.parallel_executor import ParallelExecutor
+from benchkit.run.tail_monitor import TailMonitor
+from benchkit.systems.base import SystemUnderTest
 
 
-# ==============================================================================
-# Test 1: Output callback isolates correctly
-# ==============================================================================
+@contextmanager
+def _mapped_log(path: Path) -> Iterator[mmap.mmap]:
+    """Map a task log read-only; the markers are ASCII, so no decode is needed."""
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+    ):
+        yield mapped
 
 
-def test_output_callback_isolates_parallel_output(tmp_path: Path):
-    """
-    Verify that using output_callback correctly isolates output from parallel
-    tasks with zero cross-contamination in log files.
+def _contains(mapped: mmap.mmap, text: str) -> bool:
+    """Return True if ``text`` occurs in a mapped log."""
+    return mapped.find(text.encode()) != -1
+
+
+def _any_of(markers: Iterable[str]) -> re.Pattern[bytes]:
+    """Compile markers into one alternation, so a log is scanned only once."""
+    return re.compile(b"|".join(re.escape(marker.encode()) for marker in markers))
+
+
+def _assert_log_isolation(
+    log_dir: Path,
+    names: Iterable[str],
+    own_markers: Callable[[str], Iterable[str]],
+) -> None:
+    """Assert every task log holds its own markers and none of the others'.
+
+    Each log is mapped once; the foreign check is a single regex scan.
+
+    Args:
+        log_dir: Phase log directory
+        names: Task names, one log file per name
+        own_markers: Markers that must appear in a task's own log and
+            nowhere else
     """
-    executor = ParallelExecutor(max_workers=4)
+    names = list(names)
+    for name in names:
+        log_path = log_dir / f"{name.replace('_', '-')}.log"
+        with _mapped_log(log_path) as log_content:
+            for marker in own_markers(name):
+                assert _contains(
+                    log_content, marker
+                ), f"{log_path.name} is missing {marker!r}"
+
+            foreign_markers = [
+                marker
+                for other_name in names
+                if other_name != name
+                for marker in own_markers(other_name)
+            ]
+            if not foreign_markers:
+                # An empty alternation would match at offset 0 of any log
+                continue
+            found = _any_of(foreign_markers).search(log_content)
+            assert (
+                found is None
+            ), f"{log_path.name} contains foreign output {found.group().decode()!r}"
 
-    def make_task_with_callback(name: str) -> Callable[[], str]:
-        """Create a task that uses executor.add_output()."""
 
-        def task() -> str:
-            for i in range(100):
-                executor.add_output(name, f"CALLBACK_OUTPUT_{name}_{i}")
-            return f"{name}_done"
+class _MockSystem(SystemUnderTest):
+    """Minimal SystemUnderTest whose only real behaviour is _log()."""
 
-        return task
+    def start(self) -> bool:
+        return True
 
-    tasks = {f"system_{i}": make_task_with_callback(f"system_{i}") for i in range(4)}
+    def is_healthy(self, quiet: bool = False) -> bool:
+        return True
 
-    results = executor.execute_parallel(tasks, "Callback Test", log_dir=tmp_path)
+    def create_schema(self, schema_name: str) -> bool:
+        return True
 
-    # Verify all tasks completed
-    assert all(r == f"{name}_done" for name, r in results.items())
+    def load_data(self, table_name: str, data_path: Path, **kwargs: Any) -> bool:
+        return True
 
-    # Verify ZERO cross-contamination in log files
-    log_dir = tmp_path / "callback-test"
-    for name in tasks:
-        log_path = log_dir / f"{name.replace('_', '-')}.log"
-        assert log_path.exists(), f"Log file for {name} should exist"
+    def load_data_from_iterable(
+        self, table_name: str, data_source: Any, **kwargs: Any
+    ) -> bool:
+        return True
 
-        log_content = log_path.read_text()
+    def execute_query(
+        self,
+        query: str,
+        query_name: str | None = None,
+        return_data: bool = False,
+        timeout: int | None = None,
+    ) -> dict:
+        return {"success": True}
 
-        # This task's output MUST be present
-        assert (
-            f"CALLBACK_OUTPUT_{name}_0" in log_content
-        ), f"Log for {name} should contain its own output"
+    def get_system_metrics(self) -> dict:
+        return {}
+
+    def teardown(self) -> bool:
+        return True
+
+    def simulate_setup(self) -> bool:
+        """Emit the kind of output a real installation produces."""
+        self._log(f"Starting setup for {self.name}...")
+        self._log(f"Checking if {self.name} is already installed...")
+        for i in range(20):
+            self._log(f"[{self.name}] Installation step {i}/20")
+        self._log(f"Setup complete for {self.name}")
+        return True
+
+
+# ==============================================================================
+# Test 1: Callback factory and add_output share a task log
+# ==============================================================================
 
-        # Other tasks' output MUST NOT be present
-        for other_name in tasks:
-            if other_name != name:
-                assert (
-                    f"CALLBACK_OUTPUT_{other_name}" not in log_content
-                ), f"Log for {name} should NOT contain output from {other_name}"
+
+def test_callback_factory_matches_add_output(
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    """
+    Lines sent through create_output_callback() and add_output() land in the
+    same task log, in order. Cross-contamination under load is covered by the
+    factory and stress tests below.
+    """
+    base_dir = tmp_path_factory.mktemp("po")
+    executor = ParallelExecutor(max_workers=1)
+
+    def task() -> None:
+        executor.create_output_callback("solo")("FACTORY_LINE")
+        executor.add_output("solo", "ADD_OUTPUT_LINE")
+
+    executor.execute_parallel({"solo": task}, "Factory Test", log_dir=base_dir)
+
+    lines = (base_dir / "factory-test" / "solo.log").read_text().splitlines()
+    assert lines.index("FACTORY_LINE") < lines.index("ADD_OUTPUT_LINE")
 
 
 # ==============================================================================
@@ -93,11 +171,14 @@ def test_output_callback_isolates_parallel_output(tmp_path: Path):
 # ==============================================================================
 
 
-def test_create_output_callback_routes_correctly(tmp_path: Path):
+def test_create_output_callback_routes_correctly(
+    tmp_path_factory: pytest.TempPathFactory,
+):
     """
     Verify that create_output_callback() creates a callback that routes
     output to the correct task's log file.
     """
+    base_dir = tmp_path_factory.mktemp("po")
     executor = ParallelExecutor(max_workers=2)
 
     def make_task(name: str) -> Callable[[], str]:
@@ -115,24 +196,18 @@ def test_create_output_callback_routes_correctly(tmp_path: Path):
     }
 
     results = executor.execute_parallel(
-        tasks, "Callback Factory Test", log_dir=tmp_path
+        tasks, "Callback Factory Test", log_dir=base_dir
     )
 
     assert results["alpha"] == "alpha_complete"
     assert results["beta"] == "beta_complete"
 
-    log_dir = tmp_path / "callback-factory-test"
-
-    alpha_log = (log_dir / "alpha.log").read_text()
-    beta_log = (log_dir / "beta.log").read_text()
-
-    # Alpha's log should have alpha's messages, not beta's
-    assert "MESSAGE_VIA_CALLBACK_alpha_0" in alpha_log
-    assert "MESSAGE_VIA_CALLBACK_beta_0" not in alpha_log
+    log_dir = base_dir / "callback-factory-test"
 
-    # Beta's log should have beta's messages, not alpha's
-    assert "MESSAGE_VIA_CALLBACK_beta_0" in beta_log
-    assert "MESSAGE_VIA_CALLBACK_alpha_0" not in beta_log
+    # Each log should have its own messages and none of the other task's
+    _assert_log_isolation(
+        log_dir, tasks, lambda name: [f"MESSAGE_VIA_CALLBACK_{name}_0"]
+    )
 
 
 # ==============================================================================
@@ -140,13 +215,16 @@ def test_create_output_callback_routes_correctly(tmp_path: Path):
 # ==============================================================================
 
 
-def test_parallel_output_stress_test(tmp_path: Path):
+def test_parallel_output_stress_test(
+    tmp_path_factory: pytest.TempPathFactory, num_tasks: int, iterations: int
+):
     """
-    Stress test with 8 concurrent tasks to verify no cross-contamination
-    under high load.
+    Stress test with concurrent tasks to verify no cross-contamination
+    under high load. Sizes come from the tiers in conftest; pass --thorough
+    for the large tiers.
     """
-    num_tasks = 8
-    iterations_per_task = 500
+    base_dir = tmp_path_factory.mktemp("po")
+    iterations_per_task = iterations
 
     executor = ParallelExecutor(max_workers=num_tasks)
 
@@ -163,7 +241,7 @@ def test_parallel_output_stress_test(tmp_path: Path):
 
     tasks = {f"task_{i:02d}": make_task(f"task_{i:02d}") for i in range(num_tasks)}
 
-    results = executor.execute_parallel(tasks, "Stress Test", log_dir=tmp_path)
+    results = executor.execute_parallel(tasks, "Stress Test", log_dir=base_dir)
 
     # Verify all tasks completed
     assert len(results) == num_tasks
@@ -172,24 +250,25 @@ def test_parallel_output_stress_test(tmp_path: Path):
         assert result["iterations"] == iterations_per_task
 
     # Verify ZERO cross-contamination
-    log_dir = tmp_path / "stress-test"
+    log_dir = base_dir / "stress-test"
     contamination_found = []
 
     for name in tasks:
         log_path = log_dir / f"{name.replace('_', '-')}.log"
-        log_content = log_path.read_text()
+        lines = log_path.read_bytes().splitlines()
 
-        # Count own messages
-        own_count = log_content.count(f"task_id={name}")
+        # Classify every line by its task_id in a single pass
+        task_ids = Counter(
+            line.partition(b"task_id=")[2].partition(b" ")[0].decode() for line in lines
+        )
+        own_count = task_ids[name]
 
         # Check for contamination from other tasks
-        for other_name in tasks:
-            if other_name != name:
-                other_count = log_content.count(f"task_id={other_name}")
-                if other_count > 0:
-                    contamination_found.append(
-                        f"{name}'s log contains {other_count} messages from {other_name}"
-                    )
+        for other_name, other_count in task_ids.items():
+            if other_name in tasks and other_name != name:
+                contamination_found.append(
+                    f"{name}'s log contains {other_count} messages from {other_name}"
+                )
 
         # Verify we got our own messages
         assert (
@@ -210,50 +289,6 @@ def test_system_log_uses_callback_when_provided():
     """
     Verify that SystemUnderTest._log() uses the output_callback when provided.
     """
-    base_module_path = (
-        Path(__file__).resolve().parents[1] / "benchkit" / "systems" / "base.py"
-    )
-    spec = importlib.util.spec_from_file_location(
-        "benchkit.systems.base", base_module_path
-    )
-    base_module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(base_module)
-    SystemUnderTest = base_module.SystemUnderTest
-
-    class MockSystem(SystemUnderTest):
-        def start(self) -> bool:
-            return True
-
-        def is_healthy(self, quiet: bool = False) -> bool:
-            return True
-
-        def create_schema(self, schema_name: str) -> bool:
-            return True
-
-        def load_data(self, table_name: str, data_path: Path, **kwargs: Any) -> bool:
-            return True
-
-        def load_data_from_iterable(
-            self, table_name: str, data_source: Any, **kwargs: Any
-        ) -> bool:
-            return True
-
-        def execute_query(
-            self,
-            query: str,
-            query_name: str | None = None,
-            return_data: bool = False,
-            timeout: int | None = None,
-        ) -> dict:
-            return {"success": True}
-
-        def get_system_metrics(self) -> dict:
-            return {}
-
-        def teardown(self) -> bool:
-            return True
-
     callback_messages: list[str] = []
 
     def test_callback(message: str) -> None:
@@ -265,7 +300,7 @@ def test_system_log_uses_callback_when_provided():
         "version": "1.0",
         "setup": {"method": "docker"},
     }
-    system_with_callback = MockSystem(config, output_callback=test_callback)
+    system_with_callback = _MockSystem(config, output_callback=test_callback)
 
     system_with_callback._log("Message 1")
     system_with_callback._log("Message 2")
@@ -282,62 +317,13 @@ def test_system_log_uses_callback_when_provided():
 # ==============================================================================
 
 
-def test_parallel_system_setup_simulation(tmp_path: Path):
+def test_parallel_system_setup_simulation(
+    tmp_path_factory: pytest.TempPathFactory,
+):
     """
     Integration test simulating actual parallel system setup.
     """
-    base_module_path = (
-        Path(__file__).resolve().parents[1] / "benchkit" / "systems" / "base.py"
-    )
-    spec = importlib.util.spec_from_file_location(
-        "benchkit.systems.base", base_module_path
-    )
-    base_module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(base_module)
-    SystemUnderTest = base_module.SystemUnderTest
-
-    class SimulatedDatabaseSystem(SystemUnderTest):
-        def start(self) -> bool:
-            return True
-
-        def is_healthy(self, quiet: bool = False) -> bool:
-            return True
-
-        def create_schema(self, schema_name: str) -> bool:
-            return True
-
-        def load_data(self, table_name: str, data_path: Path, **kwargs: Any) -> bool:
-            return True
-
-        def load_data_from_iterable(
-            self, table_name: str, data_source: Any, **kwargs: Any
-        ) -> bool:
-            return True
-
-        def execute_query(
-            self,
-            query: str,
-            query_name: str | None = None,
-            return_data: bool = False,
-            timeout: int | None = None,
-        ) -> dict:
-            return {"success": True}
-
-        def get_system_metrics(self) -> dict:
-            return {}
-
-        def teardown(self) -> bool:
-            return True
-
-        def simulate_setup(self) -> bool:
-            self._log(f"Starting setup for {self.name}...")
-            self._log(f"Checking if {self.name} is already installed...")
-            for i in range(20):
-                self._log(f"[{self.name}] Installation step {i}/20")
-            self._log(f"Setup complete for {self.name}")
-            return True
-
+    base_dir = tmp_path_factory.mktemp("po")
     executor = ParallelExecutor(max_workers=4)
 
     def make_system_setup_task(system_name: str) -> Callable[[], dict]:
@@ -349,7 +335,7 @@ def test_parallel_system_setup_simulation(tmp_path: Path):
                 "version": "1.0",
                 "setup": {"method": "docker"},
             }
-            system = SimulatedDatabaseSystem(config, output_callback=callback)
+            system = _MockSystem(config, output_callback=callback)
             success = system.simulate_setup()
             return {"system": system_name, "success": success}
 
@@ -359,26 +345,20 @@ def test_parallel_system_setup_simulation(tmp_path: Path):
     tasks = {name: make_system_setup_task(name) for name in system_names}
 
     results = executor.execute_parallel(
-        tasks, "System Setup Simulation", log_dir=tmp_path
+        tasks, "System Setup Simulation", log_dir=base_dir
     )
 
     for name, result in results.items():
         assert result["success"], f"System {name} setup should succeed"
         assert result["system"] == name
 
-    log_dir = tmp_path / "system-setup-simulation"
+    log_dir = base_dir / "system-setup-simulation"
 
-    for name in system_names:
-        log_path = log_dir / f"{name}.log"
-        log_content = log_path.read_text()
-
-        assert f"Starting setup for {name}" in log_content
-        assert f"[{name}] Installation step" in log_content
-
-        for other_name in system_names:
-            if other_name != name:
-                assert f"Starting setup for {other_name}" not in log_content
-                assert f"[{other_name}] Installation step" not in log_content
+    _assert_log_isolation(
+        log_dir,
+        system_names,
+        lambda name: [f"Starting setup for {name}", f"[{name}] Installation step"],
+    )
 
 
 # ==============================================================================
@@ -386,14 +366,17 @@ def test_parallel_system_setup_simulation(tmp_path: Path):
 # ==============================================================================
 
 
-def test_high_frequency_output_no_data_loss(tmp_path: Path):
+def test_high_frequency_output_no_data_loss(
+    tmp_path_factory: pytest.TempPathFactory, num_tasks: int, iterations: int
+):
     """
     Verify that rapid output from multiple tasks doesn't cause data loss.
+    Sizes come from the tiers in conftest; pass --thorough for the large tiers.
     """
-    executor = ParallelExecutor(max_workers=4)
+    base_dir = tmp_path_factory.mktemp("po")
+    executor = ParallelExecutor(max_workers=num_tasks)
 
-    messages_per_task = 1000
-    num_tasks = 4
+    messages_per_task = iterations
 
     def make_task(name: str) -> Callable[[], int]:
         def task() -> int:
@@ -406,17 +389,24 @@ def test_high_frequency_output_no_data_loss(tmp_path: Path):
 
     tasks = {f"task_{i}": make_task(f"task_{i}") for i in range(num_tasks)}
 
-    results = executor.execute_parallel(tasks, "High Frequency Test", log_dir=tmp_path)
+    results = executor.execute_parallel(tasks, "High Frequency Test", log_dir=base_dir)
 
     for _name, count in results.items():
         assert count == messages_per_task
 
-    log_dir = tmp_path / "high-frequency-test"
+    log_dir = base_dir / "high-frequency-test"
     for name in tasks:
         log_path = log_dir / f"{name.replace('_', '-')}.log"
-        log_content = log_path.read_text()
+        lines = log_path.read_bytes().splitlines()
 
-        captured_count = log_content.count(f"MSG_{name}_")
+        # Classify every MSG_<task>_<n> line by its task in a single pass
+        senders = Counter(
+            line.rpartition(b"_")[0][len(b"MSG_") :].decode()
+            for line in lines
+            if line.startswith(b"MSG_")
+        )
+        captured_count = senders.pop(name, 0)
+        assert not senders, f"{name}'s log contains messages from {dict(senders)}"
 
         assert (
             captured_count >= messages_per_task * 0.99
@@ -428,10 +418,13 @@ def test_high_frequency_output_no_data_loss(tmp_path: Path):
 # ==============================================================================
 
 
-def test_no_double_tagging(tmp_path: Path):
+def test_no_double_tagging(
+    tmp_path_factory: pytest.TempPathFactory,
+):
     """
     Verify that output already tagged is not double-tagged.
     """
+    base_dir = tmp_path_factory.mktemp("po")
     executor = ParallelExecutor(max_workers=2)
 
     def make_task(name: str) -> Callable[[], str]:
@@ -457,23 +450,44 @@ def test_no_double_tagging(tmp_path: Path):
         "clickhouse": make_task("clickhouse"),
     }
 
-    results = executor.execute_parallel(tasks, "Double Tag Test", log_dir=tmp_path)
+    results = executor.execute_parallel(tasks, "Double Tag Test", log_dir=base_dir)
 
     assert results["exasol"] == "exasol_done"
     assert results["clickhouse"] == "clickhouse_done"
 
-    log_dir = tmp_path / "double-tag-test"
+    log_dir = base_dir / "double-tag-test"
+
+    for name in tasks:
+        with _mapped_log(log_dir / f"{name}.log") as log_content:
+            # Should NOT have double tags
+            assert not _contains(
+                log_content, f"[{name}] [{name}]"
+            ), f"Found double-tag in {name}'s log"
+
+    # Should have its own query messages only
+    _assert_log_isolation(log_dir, tasks, lambda name: [f"[{name}] Query Q01"])
 
-    for name in ["exasol", "clickhouse"]:
-        log_path = log_dir / f"{name}.log"
-        log_content = log_path.read_text()
 
-        # Should NOT have double tags
-        double_tag = f"[{name}] [{name}]"
-        assert double_tag not in log_content, f"Found double-tag in {name}'s log"
+def test_tail_monitor_does_not_double_tag(
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    """
+    Verify that TailMonitor only prefixes lines that are not already tagged.
+    """
+    base_dir = tmp_path_factory.mktemp("po")
+    log_path = base_dir / "exasol.log"
+    log_path.write_text("[exasol] Query Q01 starting...\nInternal checkpoint\n")
 
-        # Should have query messages
-        assert f"[{name}] Query Q01" in log_content
+    out = io.StringIO()
+    monitor = TailMonitor({"exasol": log_path}, Console(file=out, width=200))
+    monitor.start()
+    deadline = time.monotonic() + 5
+    while out.getvalue().count("\n") < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    monitor.stop()
+
+    printed = out.getvalue().splitlines()
+    assert printed == ["[exasol] Query Q01 starting...", "[exasol] Internal checkpoint"]
 
 
 # ==============================================================================
@@ -481,16 +495,19 @@ def test_no_double_tagging(tmp_path: Path):
 # ==============================================================================
 
 
-def test_thread_local_task_identification(tmp_path: Path):
+def test_thread_local_task_identification(
+    tmp_path_factory: pytest.TempPathFactory,
+):
     """
     Verify that thread-local storage correctly identifies the current task.
     """
-    import time
-
+    base_dir = tmp_path_factory.mktemp("po")
     executor = ParallelExecutor(max_workers=4)
 
     thread_task_mapping: dict[int, str] = {}
     mapping_lock = threading.Lock()
+    # Release all four tasks at once so their output genuinely interleaves
+    start_together = threading.Barrier(4)
 
     def make_task(name: str) -> Callable[[], dict]:
         def task() -> dict:
@@ -498,8 +515,8 @@ def test_thread_local_task_identification(tmp_path: Path):
             with mapping_lock:
                 thread_task_mapping[thread_id] = name
 
+            start_together.wait(timeout=10)
             for i in range(10):
-                time.sleep(0.01)
                 executor.add_output(
                     name, f"Thread {thread_id} working on {name}, step {i}"
                 )
@@ -510,21 +527,13 @@ def test_thread_local_task_identification(tmp_path: Path):
 
     tasks = {f"task_{i}": make_task(f"task_{i}") for i in range(4)}
 
-    results = executor.execute_parallel(tasks, "Thread Local Test", log_dir=tmp_path)
+    results = executor.execute_parallel(tasks, "Thread Local Test", log_dir=base_dir)
 
     for name, result in results.items():
         assert result["name"] == name
 
-    log_dir = tmp_path / "thread-local-test"
-    for name in tasks:
-        log_path = log_dir / f"{name.replace('_', '-')}.log"
-        log_content = log_path.read_text()
-
-        assert f"working on {name}" in log_content
-
-        for other_name in tasks:
-            if other_name != name:
-                assert f"working on {other_name}" not in log_content
+    log_dir = base_dir / "thread-local-test"
+    _assert_log_isolation(log_dir, tasks, lambda name: [f"working on {name}"])
 
 
 if __name__ == "__main__":
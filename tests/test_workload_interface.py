@@ -1,3 +1,4 @@
+import functools
 from datetime import timedelta
 from itertools import product
 
@@ -16,8 +17,14 @@ def workload(request) -> Workload:
     return create_workload({"name": request.param})
 
 
+@functools.cache
+def _system_class(kind: str) -> type[SystemUnderTest]:
+    """Resolve each system kind once for the whole module."""
+    return _lazy_import_system(kind)
+
+
 def make_bare_system(kind: str) -> SystemUnderTest:
-    return _lazy_import_system(kind)(
+    return _system_class(kind)(
         {
             "name": "testsystem",
             "version": "1.0",